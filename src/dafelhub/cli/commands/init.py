@@ -3,49 +3,100 @@ DafelHub Init Command
 Initialize new projects, services, and infrastructure components.
 """
 
+from __future__ import annotations
+
+import functools
+# Path and Optional stay runtime imports: typer resolves the command
+# signatures' annotations when building the CLI.
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from typing import Set
 
-from dafelhub.core.logging import get_logger
-from dafelhub.services.project_manager import ProjectManager
-from dafelhub.services.template_engine import TemplateEngine
+    from dafelhub.services.project_manager import ProjectManager
 
-logger = get_logger(__name__)
 console = Console()
 
 app = typer.Typer(help="Initialize new projects and services")
 
+# Static panel fragments, parsed once at import; only the variable parts
+# (names, paths) are spliced in per call.
+_CHECK = Text.from_markup("[green]✓[/green] ")
+_NEXT_STEPS_HEADER = Text.from_markup("\n\n[bold]Next steps:[/bold]\n")
+_NEXT_STEPS = (
+    "1. cd {path}\n"
+    "2. dafelhub spec create\n"
+    "3. dafelhub plan generate\n"
+    "4. dafelhub deploy local"
+)
+_PROJECT_TITLE = Text.from_markup("[bold green]Project Created[/bold green]")
+_SERVICE_TITLE = Text.from_markup("[bold green]Service Created[/bold green]")
+_AGENT_TITLE = Text.from_markup("[bold green]Agent Created[/bold green]")
+
+# Pre-styled header prefixes, echoed without going through Rich markup
+_PROJECT_HEADER = typer.style("Initializing project:", fg=typer.colors.BLUE, bold=True) + " "
+_SERVICE_HEADER = typer.style("Creating service:", fg=typer.colors.BLUE, bold=True) + " "
+_AGENT_HEADER = typer.style("Creating AI agent:", fg=typer.colors.BLUE, bold=True) + " "
+
+_PROJECT_FEATURES = ("ai", "monitoring", "testing")
+
+# Parameter declarations, built once at import and shared by the signatures
+_PROJECT_NAME_ARG = typer.Argument(..., help="Project name")
+_PROJECT_PATH_OPT = typer.Option(None, "--path", "-p", help="Project directory path")
+_PROJECT_TEMPLATE_OPT = typer.Option("saas-service", "--template", "-t", help="Project template")
+_INTERACTIVE_OPT = typer.Option(True, "--interactive/--no-interactive", help="Interactive mode")
+_SERVICE_NAME_ARG = typer.Argument(..., help="Service name")
+_SERVICE_TYPE_OPT = typer.Option("api", "--type", "-t", help="Service type")
+_AGENT_NAME_ARG = typer.Argument(..., help="Agent name")
+_AGENT_TYPE_OPT = typer.Option("general", "--type", "-t", help="Agent specialization")
+
+
+@functools.lru_cache(maxsize=1)
+def _project_manager() -> ProjectManager:
+    """
+    Shared ProjectManager instance, created on first use
+    """
+    from dafelhub.services.project_manager import ProjectManager
+    return ProjectManager()
+
+
+def _log_error(message: str) -> None:
+    """
+    Log an error, initializing the logging subsystem only when needed
+    """
+    from dafelhub.core.logging import get_logger
+    get_logger(__name__).error(message)
+
+
+def _parse_features(answer: str) -> Set[str]:
+    """
+    Parse a comma-separated feature toggle answer into known feature names
+    """
+    requested = {item.strip().lower() for item in answer.split(",") if item.strip()}
+    unknown = requested.difference(_PROJECT_FEATURES)
+    if unknown:
+        console.print(f"[yellow]Ignoring unknown features:[/yellow] {', '.join(sorted(unknown))}")
+    return requested.intersection(_PROJECT_FEATURES)
+
 
 @app.command()
 def project(
-    name: str = typer.Argument(..., help="Project name"),
-    path: Optional[Path] = typer.Option(
-        None,
-        "--path", 
-        "-p", 
-        help="Project directory path"
-    ),
-    template: str = typer.Option(
-        "saas-service",
-        "--template",
-        "-t",
-        help="Project template"
-    ),
-    interactive: bool = typer.Option(
-        True,
-        "--interactive/--no-interactive",
-        help="Interactive mode"
-    )
+    name: str = _PROJECT_NAME_ARG,
+    path: Optional[Path] = _PROJECT_PATH_OPT,
+    template: str = _PROJECT_TEMPLATE_OPT,
+    interactive: bool = _INTERACTIVE_OPT
 ) -> None:
     """
     🚀 Initialize a new DafelHub project
     """
-    console.print(f"[bold blue]Initializing project:[/bold blue] {name}")
+    typer.echo(_PROJECT_HEADER + name)
     
     # Interactive project setup
     if interactive:
@@ -55,20 +106,28 @@ def project(
             default="saas-service"
         )
         
-        enable_ai = Confirm.ask("Enable AI agents integration?", default=True)
-        enable_monitoring = Confirm.ask("Enable monitoring and observability?", default=True)
-        enable_testing = Confirm.ask("Enable comprehensive testing suite?", default=True)
+        # Ask for all feature toggles in a single round-trip
+        features = _parse_features(Prompt.ask(
+            "Enabled features (comma-separated: ai, monitoring, testing)",
+            default=",".join(_PROJECT_FEATURES)
+        ))
+        enable_ai = "ai" in features
+        enable_monitoring = "monitoring" in features
+        enable_testing = "testing" in features
         
         # Show configuration summary
+        rows = [
+            ("Name", name),
+            ("Type", project_type),
+            ("AI Integration", "✓" if enable_ai else "✗"),
+            ("Monitoring", "✓" if enable_monitoring else "✗"),
+            ("Testing Suite", "✓" if enable_testing else "✗"),
+        ]
         config_table = Table(title="Project Configuration")
         config_table.add_column("Setting", style="cyan")
         config_table.add_column("Value", style="green")
-        
-        config_table.add_row("Name", name)
-        config_table.add_row("Type", project_type)
-        config_table.add_row("AI Integration", "✓" if enable_ai else "✗")
-        config_table.add_row("Monitoring", "✓" if enable_monitoring else "✗")
-        config_table.add_row("Testing Suite", "✓" if enable_testing else "✗")
+        for row in rows:
+            config_table.add_row(*row)
         
         console.print(config_table)
         
@@ -78,7 +137,7 @@ def project(
     
     try:
         # Initialize project using ProjectManager service
-        project_manager = ProjectManager()
+        project_manager = _project_manager()
         project_path = project_manager.create_project(
             name=name,
             template=template,
@@ -91,69 +150,62 @@ def project(
         )
         
         console.print(Panel(
-            f"[green]✓[/green] Project '{name}' created successfully!\n"
-            f"[dim]Location: {project_path}[/dim]\n\n"
-            f"[bold]Next steps:[/bold]\n"
-            f"1. cd {project_path}\n"
-            f"2. dafelhub spec create\n"
-            f"3. dafelhub plan generate\n"
-            f"4. dafelhub deploy local",
-            title="[bold green]Project Created[/bold green]",
+            Text.assemble(
+                _CHECK,
+                f"Project '{name}' created successfully!\n",
+                (f"Location: {project_path}", "dim"),
+                _NEXT_STEPS_HEADER,
+                _NEXT_STEPS.format(path=project_path),
+            ),
+            title=_PROJECT_TITLE,
             border_style="green"
         ))
         
     except Exception as e:
-        logger.error(f"Failed to create project: {e}")
+        _log_error(f"Failed to create project: {e}")
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
 @app.command()
 def service(
-    name: str = typer.Argument(..., help="Service name"),
-    service_type: str = typer.Option(
-        "api",
-        "--type",
-        "-t", 
-        help="Service type"
-    )
+    name: str = _SERVICE_NAME_ARG,
+    service_type: str = _SERVICE_TYPE_OPT
 ) -> None:
     """
     🔧 Initialize a new microservice
     """
-    console.print(f"[bold blue]Creating service:[/bold blue] {name}")
+    typer.echo(_SERVICE_HEADER + name)
     
     try:
-        project_manager = ProjectManager()
+        project_manager = _project_manager()
         service_path = project_manager.create_service(name, service_type)
         
         console.print(Panel(
-            f"[green]✓[/green] Service '{name}' created!\n"
-            f"[dim]Location: {service_path}[/dim]",
-            title="[bold green]Service Created[/bold green]",
+            Text.assemble(
+                _CHECK,
+                f"Service '{name}' created!\n",
+                (f"Location: {service_path}", "dim"),
+            ),
+            title=_SERVICE_TITLE,
             border_style="green"
         ))
         
     except Exception as e:
-        logger.error(f"Failed to create service: {e}")
+        _log_error(f"Failed to create service: {e}")
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
 @app.command()
 def agent(
-    name: str = typer.Argument(..., help="Agent name"),
-    agent_type: str = typer.Option(
-        "general",
-        "--type",
-        "-t",
-        help="Agent specialization"
-    )
+    name: str = _AGENT_NAME_ARG,
+    agent_type: str = _AGENT_TYPE_OPT
 ) -> None:
     """
     🤖 Initialize a new AI agent
     """
-    console.print(f"[bold blue]Creating AI agent:[/bold blue] {name}")
+    typer.echo(_AGENT_HEADER + name)
     
     specializations = [
         "general", "data-analysis", "code-review", 
@@ -168,18 +220,20 @@ def agent(
         )
     
     try:
-        project_manager = ProjectManager()
+        project_manager = _project_manager()
         agent_path = project_manager.create_agent(name, agent_type)
         
         console.print(Panel(
-            f"[green]✓[/green] AI Agent '{name}' created!\n"
-            f"[dim]Specialization: {agent_type}[/dim]\n"
-            f"[dim]Location: {agent_path}[/dim]",
-            title="[bold green]Agent Created[/bold green]",
+            Text.assemble(
+                _CHECK,
+                f"AI Agent '{name}' created!\n",
+                (f"Specialization: {agent_type}\nLocation: {agent_path}", "dim"),
+            ),
+            title=_AGENT_TITLE,
             border_style="green"
         ))
         
     except Exception as e:
-        logger.error(f"Failed to create agent: {e}")
+        _log_error(f"Failed to create agent: {e}")
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
\ No newline at end of file
@@ -3,22 +3,29 @@ DafelHub Monitor Command
 Enterprise monitoring, metrics collection, and observability platform.
 """
 
+import csv
+import queue
+import sys
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Iterator, Mapping, Tuple
 from enum import Enum
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.layout import Layout
-from rich.live import Live
-from rich.tree import Tree
-from rich.columns import Columns
+from rich.text import Text
 import time
 import asyncio
-import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from dafelhub.core.logging import get_logger, LoggerMixin
 from dafelhub.core.config import settings
@@ -49,102 +56,228 @@ class AlertSeverity(str, Enum):
     INFO = "info"
 
 
+# Bound formatter for the one-decimal metric cells rendered every tick
+_fmt1 = "{:.1f}".format
+
+# Display color per alert severity
+_SEVERITY_COLOR: Dict[str, str] = {
+    AlertSeverity.CRITICAL.value: "red",
+    AlertSeverity.HIGH.value: "orange1",
+    AlertSeverity.MEDIUM.value: "yellow",
+    AlertSeverity.LOW.value: "blue",
+    AlertSeverity.INFO.value: "white",
+}
+
+# Pre-styled severity labels for table cells, so rows skip markup parsing
+_SEVERITY_TEXT: Dict[str, Text] = {
+    severity: Text(severity.upper(), style=color)
+    for severity, color in _SEVERITY_COLOR.items()
+}
+
+# Display order for grouped alerts, most severe first
+_SEVERITY_ORDER: Tuple[str, ...] = tuple(severity.value for severity in AlertSeverity)
+
+# Per-severity group headings for the alerts command
+_SEVERITY_HEADING: Dict[str, str] = {
+    severity: f"\n[bold {color}]{severity.upper()} ALERTS ({{count}})[/bold {color}]"
+    for severity, color in _SEVERITY_COLOR.items()
+}
+
+# Mock metric snapshots; read-only so they can be shared between calls
+_STATIC_METRICS: Dict[MetricType, Mapping[str, Any]] = {
+    MetricType.PERFORMANCE: MappingProxyType({
+        "cpu_usage": 45.2,
+        "memory_usage": 62.8,
+        "disk_usage": 34.1,
+        "network_io": 128.4
+    }),
+    MetricType.AVAILABILITY: MappingProxyType({
+        "uptime": 99.95,
+        "downtime_minutes": 3.6,
+        "health_check_success_rate": 99.8
+    }),
+    MetricType.ERROR_RATE: MappingProxyType({
+        "error_rate": 0.12,
+        "5xx_errors": 8,
+        "4xx_errors": 24,
+        "total_requests": 10542
+    }),
+    MetricType.THROUGHPUT: MappingProxyType({
+        "requests_per_second": 142.5,
+        "requests_per_minute": 8550,
+        "peak_rps": 289.7
+    }),
+    MetricType.LATENCY: MappingProxyType({
+        "avg_response_time": 85.2,
+        "p95_response_time": 156.8,
+        "p99_response_time": 234.5
+    }),
+}
+
+
+def _synthetic_history(hours: int) -> Tuple[List[int], List[Tuple[float, float, float, float]]]:
+    """
+    Generate mock hourly history, oldest first
+    
+    Returns the hours-ago offset of each row and one
+    ``(cpu_usage, memory_usage, response_time, error_rate)`` tuple per row.
+    """
+    hours_ago = list(range(hours - 1, -1, -1))
+    data = [
+        (
+            45 + (i % 20) - 10,
+            60 + (i % 15) - 7,
+            80 + (i % 30) - 15,
+            max(0, 0.1 + (i % 5) * 0.02),
+        )
+        for i in hours_ago
+    ]
+    return hours_ago, data
+
+
+def _describe_metric(metric_name: str) -> Tuple[str, bool, bool]:
+    """
+    Display title plus usage/rate flags for a metric name
+    """
+    return (
+        metric_name.replace("_", " ").title(),
+        "usage" in metric_name,
+        "rate" in metric_name,
+    )
+
+
+# Precomputed display metadata for every known metric name
+_METRIC_META: Dict[str, Tuple[str, bool, bool]] = {
+    metric_name: _describe_metric(metric_name)
+    for metric_names in (*_STATIC_METRICS.values(), ("custom_metric_1", "custom_metric_2", "timestamp"))
+    for metric_name in metric_names
+}
+
+
+def _metric_meta(metric_name: str) -> Tuple[str, bool, bool]:
+    """
+    Look up display metadata for a metric, caching names not seen before
+    """
+    meta = _METRIC_META.get(metric_name)
+    if meta is None:
+        meta = _METRIC_META[metric_name] = _describe_metric(metric_name)
+    return meta
+
+
 class MonitoringEngine(LoggerMixin):
     """
     Enterprise monitoring and observability engine
     """
     
+    # Alert rules per metric type:
+    # (metric name, threshold, severity, alert id prefix, message template)
+    _ALERT_RULES: Dict[MetricType, Tuple[Tuple[str, float, AlertSeverity, str, str], ...]] = {
+        MetricType.PERFORMANCE: (
+            ("cpu_usage", 80, AlertSeverity.HIGH, "cpu", "High CPU usage: {value}%"),
+        ),
+        MetricType.ERROR_RATE: (
+            ("error_rate", 1.0, AlertSeverity.CRITICAL, "error", "High error rate: {value}%"),
+        ),
+        MetricType.LATENCY: (
+            ("p95_response_time", 200, AlertSeverity.MEDIUM, "latency", "High latency: {value}ms"),
+        ),
+    }
+    _ALL_ALERT_RULES = tuple(rule for rules in _ALERT_RULES.values() for rule in rules)
+    
     def __init__(self):
         self.metrics_store: Dict[str, List[Dict[str, Any]]] = {}
         self.alerts: List[Dict[str, Any]] = []
         self.dashboards: Dict[str, Dict[str, Any]] = {}
         
-    def collect_metrics(self, service: str, metric_type: MetricType) -> Dict[str, Any]:
+    async def collect_metrics(
+        self,
+        service: str,
+        metric_type: MetricType,
+        now: Optional[datetime] = None
+    ) -> Mapping[str, Any]:
         """
         Collect metrics for a specific service
+        
+        The returned mapping may be shared and must not be mutated. ``now``
+        lets refresh loops reuse one timestamp per tick.
         """
         self.logger.info(f"Collecting {metric_type.value} metrics for {service}")
         
         # Mock metric data based on type
-        if metric_type == MetricType.PERFORMANCE:
-            return {
-                "cpu_usage": 45.2,
-                "memory_usage": 62.8,
-                "disk_usage": 34.1,
-                "network_io": 128.4
-            }
-        elif metric_type == MetricType.AVAILABILITY:
-            return {
-                "uptime": 99.95,
-                "downtime_minutes": 3.6,
-                "health_check_success_rate": 99.8
-            }
-        elif metric_type == MetricType.ERROR_RATE:
-            return {
-                "error_rate": 0.12,
-                "5xx_errors": 8,
-                "4xx_errors": 24,
-                "total_requests": 10542
-            }
-        elif metric_type == MetricType.THROUGHPUT:
-            return {
-                "requests_per_second": 142.5,
-                "requests_per_minute": 8550,
-                "peak_rps": 289.7
-            }
-        elif metric_type == MetricType.LATENCY:
-            return {
-                "avg_response_time": 85.2,
-                "p95_response_time": 156.8,
-                "p99_response_time": 234.5
-            }
-        else:
-            return {
-                "custom_metric_1": 42.0,
-                "custom_metric_2": 3.14,
-                "timestamp": datetime.now().isoformat()
-            }
+        static_metrics = _STATIC_METRICS.get(metric_type)
+        if static_metrics is not None:
+            return static_metrics
+        
+        return {
+            "custom_metric_1": 42.0,
+            "custom_metric_2": 3.14,
+            "timestamp": (now or datetime.now()).isoformat()
+        }
     
-    def generate_alerts(self, service: str, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def collect_all(
+        self,
+        services: List[str],
+        metric_type: MetricType,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Mapping[str, Any]]:
         """
-        Generate alerts based on metric thresholds
+        Collect one metric type for several services concurrently
         """
-        alerts = []
-        
-        # CPU usage alert
-        if metrics.get("cpu_usage", 0) > 80:
-            alerts.append({
-                "id": f"cpu-{service}-{int(time.time())}",
-                "service": service,
-                "severity": AlertSeverity.HIGH.value,
-                "message": f"High CPU usage: {metrics['cpu_usage']}%",
-                "timestamp": datetime.now().isoformat(),
-                "threshold": 80
-            })
+        results = await asyncio.gather(
+            *(self.collect_metrics(service, metric_type, now) for service in services)
+        )
+        return dict(zip(services, results))
+    
+    async def collect_types(
+        self,
+        service: str,
+        metric_types: List[MetricType],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Mapping[str, Any]]:
+        """
+        Collect several metric types for one service concurrently
+        """
+        results = await asyncio.gather(
+            *(self.collect_metrics(service, metric_type, now) for metric_type in metric_types)
+        )
+        return {metric_type.value: result for metric_type, result in zip(metric_types, results)}
+    
+    def generate_alerts(
+        self,
+        service: str,
+        metrics: Mapping[str, Any],
+        now: Optional[datetime] = None,
+        metric_type: Optional[MetricType] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate alerts based on metric thresholds
         
-        # Error rate alert  
-        if metrics.get("error_rate", 0) > 1.0:
-            alerts.append({
-                "id": f"error-{service}-{int(time.time())}",
-                "service": service,
-                "severity": AlertSeverity.CRITICAL.value,
-                "message": f"High error rate: {metrics['error_rate']}%",
-                "timestamp": datetime.now().isoformat(),
-                "threshold": 1.0
-            })
+        When ``metric_type`` is given only the thresholds that apply to that
+        type are evaluated. Alerts are yielded lazily; callers that need a
+        sequence should collect them with ``list()`` or ``extend()``.
+        """
+        if metric_type is None:
+            rules = self._ALL_ALERT_RULES
+        else:
+            rules = self._ALERT_RULES.get(metric_type, ())
+        if not rules:
+            return
         
-        # Response time alert
-        if metrics.get("p95_response_time", 0) > 200:
-            alerts.append({
-                "id": f"latency-{service}-{int(time.time())}",
-                "service": service,
-                "severity": AlertSeverity.MEDIUM.value,
-                "message": f"High latency: {metrics['p95_response_time']}ms",
-                "timestamp": datetime.now().isoformat(),
-                "threshold": 200
-            })
+        now = now or datetime.now()
+        timestamp = now.isoformat()
+        epoch = int(now.timestamp())
         
-        return alerts
+        for metric_name, threshold, severity, prefix, message in rules:
+            value = metrics.get(metric_name, 0)
+            if value > threshold:
+                yield {
+                    "id": f"{prefix}-{service}-{epoch}",
+                    "service": service,
+                    "severity": severity.value,
+                    "message": message.format(value=value),
+                    "timestamp": timestamp,
+                    "threshold": threshold
+                }
     
     def create_dashboard(self, name: str, services: List[str]) -> Dict[str, Any]:
         """
@@ -177,6 +310,38 @@ class MonitoringEngine(LoggerMixin):
         return dashboard
 
 
+def _collect_snapshots(
+    monitoring: MonitoringEngine,
+    services: List[str],
+    refresh: int,
+    snapshots: "queue.Queue[Tuple[datetime, Dict[str, Mapping[str, Any]]]]",
+    stop: threading.Event
+) -> None:
+    """
+    Dashboard collector loop: publish a metrics snapshot every refresh tick
+    
+    Only the latest snapshot is kept; an unread one is replaced.
+    """
+    next_tick = time.monotonic()
+    while not stop.is_set():
+        now = datetime.now()
+        try:
+            snapshot = asyncio.run(
+                monitoring.collect_all(services, MetricType.PERFORMANCE, now)
+            )
+        except Exception as e:
+            logger.error(f"Dashboard metric collection failed: {e}")
+        else:
+            try:
+                snapshots.get_nowait()
+            except queue.Empty:
+                pass
+            snapshots.put((now, snapshot))
+        
+        next_tick += refresh
+        stop.wait(max(0.0, next_tick - time.monotonic()))
+
+
 @app.command()
 def dashboard(
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Dashboard name"),
@@ -195,6 +360,9 @@ def dashboard(
     console.print(f"[bold blue]Monitoring Dashboard:[/bold blue] {name}")
     console.print(f"[dim]Services: {', '.join(service_list)} | Refresh: {refresh}s[/dim]\n")
     
+    from rich.layout import Layout
+    from rich.live import Live
+    
     monitoring = MonitoringEngine()
     
     # Create dashboard layout
@@ -210,9 +378,37 @@ def dashboard(
         Layout(name="right")
     )
     
+    # Static regions are built once; tables with per-tick rows are rebuilt
+    no_alerts_panel = Panel(
+        "[green]No active alerts[/green]\n\n[dim]All services operating normally[/dim]",
+        title="System Status",
+        border_style="green"
+    )
+    
+    footer_table = Table.grid()
+    footer_table.add_column()
+    footer_table.add_row("[dim]Press Ctrl+C to exit | Commands: dafelhub monitor service <name> | dafelhub monitor alerts[/dim]")
+    layout["footer"].update(footer_table)
+    
+    # Metrics are collected on a background thread; the render loop always
+    # picks up the freshest snapshot, so a slow backend cannot stall the UI
+    snapshots: "queue.Queue[Tuple[datetime, Dict[str, Mapping[str, Any]]]]" = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    collector = threading.Thread(
+        target=_collect_snapshots,
+        args=(monitoring, service_list, refresh, snapshots, stop),
+        name="dashboard-collector",
+        daemon=True
+    )
+    collector.start()
+    
     try:
-        with Live(layout, refresh_per_second=1/refresh, screen=True) as live:
+        # Refresh manually so each tick is rendered exactly once, after all
+        # layout regions have been updated
+        with Live(layout, auto_refresh=False, screen=True) as live:
             while True:
+                now, all_metrics = snapshots.get()
+                
                 # Header
                 header_table = Table.grid()
                 header_table.add_column()
@@ -220,16 +416,11 @@ def dashboard(
                     f"[bold]DafelHub Monitoring Dashboard[/bold] - {name}",
                 )
                 header_table.add_row(
-                    f"[dim]Last updated: {datetime.now().strftime('%H:%M:%S')} | "
+                    f"[dim]Last updated: {now.strftime('%H:%M:%S')} | "
                     f"Services: {len(service_list)} | Auto-refresh: {refresh}s[/dim]"
                 )
                 layout["header"].update(Panel(header_table, border_style="blue"))
                 
-                # Collect current metrics
-                all_metrics = {}
-                for service in service_list:
-                    all_metrics[service] = monitoring.collect_metrics(service, MetricType.PERFORMANCE)
-                
                 # Left panel - Service metrics
                 metrics_table = Table(title="Service Metrics")
                 metrics_table.add_column("Service", style="cyan")
@@ -251,8 +442,8 @@ def dashboard(
                     
                     metrics_table.add_row(
                         service,
-                        f"{cpu:.1f}",
-                        f"{memory:.1f}",
+                        _fmt1(cpu),
+                        _fmt1(memory),
                         status
                     )
                 
@@ -261,8 +452,7 @@ def dashboard(
                 # Right panel - Alerts and logs
                 alerts = []
                 for service, metrics in all_metrics.items():
-                    service_alerts = monitoring.generate_alerts(service, metrics)
-                    alerts.extend(service_alerts)
+                    alerts.extend(monitoring.generate_alerts(service, metrics, now, MetricType.PERFORMANCE))
                 
                 if alerts:
                     alert_table = Table(title="Active Alerts")
@@ -271,43 +461,32 @@ def dashboard(
                     alert_table.add_column("Message", style="white")
                     
                     for alert in alerts[-5:]:  # Show last 5 alerts
-                        severity_color = {
-                            "critical": "red",
-                            "high": "orange1", 
-                            "medium": "yellow",
-                            "low": "green"
-                        }.get(alert["severity"], "white")
-                        
+                        severity = alert["severity"]
                         alert_table.add_row(
                             alert["service"],
-                            f"[{severity_color}]{alert['severity'].upper()}[/{severity_color}]",
+                            _SEVERITY_TEXT.get(severity) or Text(severity.upper(), style="white"),
                             alert["message"]
                         )
                     
                     layout["right"].update(Panel(alert_table, title="Alerts", border_style="red"))
                 else:
-                    layout["right"].update(Panel(
-                        "[green]No active alerts[/green]\n\n[dim]All services operating normally[/dim]",
-                        title="System Status",
-                        border_style="green"
-                    ))
-                
-                # Footer
-                footer_table = Table.grid()
-                footer_table.add_column()
-                footer_table.add_row("[dim]Press Ctrl+C to exit | Commands: dafelhub monitor service <name> | dafelhub monitor alerts[/dim]")
-                layout["footer"].update(footer_table)
+                    layout["right"].update(no_alerts_panel)
                 
-                time.sleep(refresh)
+                live.refresh()
                 
     except KeyboardInterrupt:
+        stop.set()
         console.print("\n[dim]Dashboard stopped[/dim]")
         
         if save:
             dashboard_config = monitoring.create_dashboard(name, service_list)
             config_path = Path(f"{name}-dashboard.json")
-            with open(config_path, 'w') as f:
-                json.dump(dashboard_config, f, indent=2)
+            if ORJSON_AVAILABLE:
+                config_path.write_bytes(orjson.dumps(dashboard_config, option=orjson.OPT_INDENT_2))
+            else:
+                import json
+                with open(config_path, 'w') as f:
+                    json.dump(dashboard_config, f, indent=2)
             console.print(f"[green]Dashboard configuration saved to {config_path}[/green]")
 
 
@@ -329,26 +508,34 @@ def service(
     console.print(f"[bold blue]Monitoring service:[/bold blue] {name}")
     console.print(f"[dim]Metric type: {metric_type.value} | Duration: {duration}s[/dim]\n")
     
+    from rich.live import Live
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    
     monitoring = MonitoringEngine()
-    start_time = time.time()
+    # Monotonic clock for durations: immune to wall-clock adjustments
+    start_time = time.monotonic()
+    next_tick = start_time
     
-    with Progress(
+    progress = Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         console=console
-    ) as progress:
-        
-        monitor_task = progress.add_task("Collecting metrics...", total=duration)
-        
+    )
+    monitor_task = progress.add_task("Collecting metrics...", total=duration)
+    
+    # A single Live region holds the progress bar and the metrics view, so
+    # each poll redraws in place instead of clearing and reprinting the screen
+    with Live(progress, console=console, auto_refresh=False) as live:
         try:
-            while time.time() - start_time < duration:
-                elapsed = time.time() - start_time
+            while time.monotonic() - start_time < duration:
+                elapsed = time.monotonic() - start_time
                 progress.update(monitor_task, completed=elapsed)
                 
                 # Collect metrics
-                metrics = monitoring.collect_metrics(name, metric_type)
+                now = datetime.now()
+                metrics = asyncio.run(monitoring.collect_metrics(name, metric_type, now))
                 
                 # Display current metrics
                 current_table = Table(title=f"{name} - {metric_type.value.title()} Metrics")
@@ -357,12 +544,14 @@ def service(
                 current_table.add_column("Status", style="bold")
                 
                 for metric_name, value in metrics.items():
+                    title, is_usage, _ = _metric_meta(metric_name)
+                    
                     # Determine status based on metric type and value
                     if isinstance(value, (int, float)):
                         if metric_type == MetricType.PERFORMANCE:
-                            if "usage" in metric_name.lower() and value > 80:
+                            if is_usage and value > 80:
                                 status = "[red]HIGH[/red]"
-                            elif "usage" in metric_name.lower() and value > 60:
+                            elif is_usage and value > 60:
                                 status = "[yellow]MODERATE[/yellow]"
                             else:
                                 status = "[green]NORMAL[/green]"
@@ -370,36 +559,38 @@ def service(
                             status = "[green]OK[/green]"
                         
                         current_table.add_row(
-                            metric_name.replace("_", " ").title(),
-                            f"{value:.1f}" if isinstance(value, float) else str(value),
+                            title,
+                            _fmt1(value) if isinstance(value, float) else str(value),
                             status
                         )
                     else:
                         current_table.add_row(
-                            metric_name.replace("_", " ").title(),
+                            title,
                             str(value),
                             "[green]OK[/green]"
                         )
                 
-                console.clear()
-                console.print(f"[bold blue]Monitoring:[/bold blue] {name} ({metric_type.value})")
-                console.print(f"[dim]Elapsed: {elapsed:.1f}s / {duration}s[/dim]\n")
-                console.print(current_table)
+                view = [
+                    f"[bold blue]Monitoring:[/bold blue] {name} ({metric_type.value})",
+                    f"[dim]Elapsed: {elapsed:.1f}s / {duration}s[/dim]\n",
+                    current_table,
+                ]
                 
                 # Generate and show alerts if enabled
                 if threshold_alerts:
-                    alerts = monitoring.generate_alerts(name, metrics)
+                    alerts = list(monitoring.generate_alerts(name, metrics, now, metric_type))
                     if alerts:
-                        console.print("\n[bold red]ALERTS:[/bold red]")
+                        view.append("\n[bold red]ALERTS:[/bold red]")
                         for alert in alerts:
-                            severity_color = {
-                                "critical": "red",
-                                "high": "orange1",
-                                "medium": "yellow"
-                            }.get(alert["severity"], "white")
-                            console.print(f"[{severity_color}]• {alert['message']}[/{severity_color}]")
+                            severity_color = _SEVERITY_COLOR.get(alert["severity"], "white")
+                            view.append(Text(f"• {alert['message']}", style=severity_color))
+                
+                view.append(progress)
+                live.update(Group(*view), refresh=True)
                 
-                time.sleep(2)
+                # Sleep until the next poll slot so render time does not drift
+                next_tick += 2
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 
         except KeyboardInterrupt:
             console.print("\n[dim]Monitoring stopped by user[/dim]")
@@ -426,6 +617,8 @@ def alerts(
     """
     console.print("[bold blue]System Alerts[/bold blue]")
     
+    now = datetime.now()
+    
     # Mock alert data
     mock_alerts = [
         {
@@ -433,7 +626,8 @@ def alerts(
             "service": "api-service",
             "severity": "critical",
             "message": "Service unresponsive for 5 minutes",
-            "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat(),
+            "timestamp": (now - timedelta(minutes=5)).isoformat(),
+            "_epoch": int((now - timedelta(minutes=5)).timestamp()),
             "resolved": False
         },
         {
@@ -441,7 +635,8 @@ def alerts(
             "service": "worker-service",
             "severity": "high",
             "message": "High memory usage detected (89%)",
-            "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat(),
+            "timestamp": (now - timedelta(minutes=15)).isoformat(),
+            "_epoch": int((now - timedelta(minutes=15)).timestamp()),
             "resolved": False
         },
         {
@@ -449,7 +644,8 @@ def alerts(
             "service": "auth-service", 
             "severity": "medium",
             "message": "Response time above threshold (250ms)",
-            "timestamp": (datetime.now() - timedelta(hours=1)).isoformat(),
+            "timestamp": (now - timedelta(hours=1)).isoformat(),
+            "_epoch": int((now - timedelta(hours=1)).timestamp()),
             "resolved": True
         },
         {
@@ -457,25 +653,21 @@ def alerts(
             "service": "api-service",
             "severity": "low",
             "message": "SSL certificate expires in 30 days",
-            "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
+            "timestamp": (now - timedelta(hours=2)).isoformat(),
+            "_epoch": int((now - timedelta(hours=2)).timestamp()),
             "resolved": False
         }
     ]
     
-    # Filter alerts
-    filtered_alerts = mock_alerts
-    
-    if severity:
-        filtered_alerts = [a for a in filtered_alerts if a["severity"] == severity.value]
-    
-    if service:
-        filtered_alerts = [a for a in filtered_alerts if a["service"] == service]
-    
-    # Filter by time
-    cutoff_time = datetime.now() - timedelta(hours=last_hours)
+    # Filter alerts in a single pass
+    now_epoch = int(now.timestamp())
+    cutoff_epoch = now_epoch - last_hours * 3600
+    severity_value = severity.value if severity else None
     filtered_alerts = [
-        a for a in filtered_alerts 
-        if datetime.fromisoformat(a["timestamp"]) > cutoff_time
+        a for a in mock_alerts
+        if (severity_value is None or a["severity"] == severity_value)
+        and (not service or a["service"] == service)
+        and a["_epoch"] > cutoff_epoch
     ]
     
     if not filtered_alerts:
@@ -488,29 +680,17 @@ def alerts(
         return
     
     # Group alerts by severity
-    alert_groups = {
-        "critical": [],
-        "high": [],
-        "medium": [],
-        "low": []
-    }
-    
+    alert_groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for alert in filtered_alerts:
         alert_groups[alert["severity"]].append(alert)
     
-    # Display alerts by severity
-    for severity_level, alerts in alert_groups.items():
+    # Display alerts by severity, most severe first
+    for severity_level in _SEVERITY_ORDER:
+        alerts = alert_groups.get(severity_level)
         if not alerts:
             continue
             
-        severity_color = {
-            "critical": "red",
-            "high": "orange1",
-            "medium": "yellow", 
-            "low": "blue"
-        }.get(severity_level, "white")
-        
-        console.print(f"\n[bold {severity_color}]{severity_level.upper()} ALERTS ({len(alerts)})[/bold {severity_color}]")
+        console.print(_SEVERITY_HEADING[severity_level].format(count=len(alerts)))
         
         alert_table = Table()
         alert_table.add_column("Service", style="cyan")
@@ -519,13 +699,8 @@ def alerts(
         alert_table.add_column("Status", style="bold")
         
         for alert in alerts:
-            timestamp = datetime.fromisoformat(alert["timestamp"])
-            time_ago = datetime.now() - timestamp
-            
-            if time_ago.total_seconds() < 3600:
-                time_str = f"{int(time_ago.total_seconds() / 60)}m ago"
-            else:
-                time_str = f"{int(time_ago.total_seconds() / 3600)}h ago"
+            age = now_epoch - alert["_epoch"]
+            time_str = f"{age // 60}m ago" if age < 3600 else f"{age // 3600}h ago"
             
             status = "[green]RESOLVED[/green]" if alert["resolved"] else "[red]ACTIVE[/red]"
             
@@ -581,9 +756,7 @@ def metrics(
         types_to_collect = [MetricType.PERFORMANCE, MetricType.AVAILABILITY, MetricType.LATENCY]
     
     # Collect all requested metrics
-    all_metrics = {}
-    for metric_type in types_to_collect:
-        all_metrics[metric_type.value] = monitoring.collect_metrics(service, metric_type)
+    all_metrics = asyncio.run(monitoring.collect_types(service, types_to_collect))
     
     if format_output == "json":
         # JSON output
@@ -591,16 +764,17 @@ def metrics(
             "service": service,
             "timestamp": datetime.now().isoformat(),
             "time_range": time_range,
-            "metrics": all_metrics
+            "metrics": {k: dict(v) for k, v in all_metrics.items()}
         }
         console.print_json(data=output)
         
     elif format_output == "csv":
-        # CSV output
-        console.print("metric_type,metric_name,value")
+        # CSV output, written straight to stdout so values are quoted
+        # properly and never pass through Rich's renderer
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(("metric_type", "metric_name", "value"))
         for metric_type, metrics in all_metrics.items():
-            for metric_name, value in metrics.items():
-                console.print(f"{metric_type},{metric_name},{value}")
+            writer.writerows((metric_type, metric_name, value) for metric_name, value in metrics.items())
                 
     else:
         # Table output (default)
@@ -612,11 +786,13 @@ def metrics(
             metric_table.add_column("Status", style="bold")
             
             for metric_name, value in metrics.items():
+                title, is_usage, is_rate = _metric_meta(metric_name)
+                
                 # Define thresholds based on metric type
-                if metric_type == "performance":
-                    threshold = 80 if "usage" in metric_name else "N/A"
-                    if isinstance(threshold, (int, float)) and isinstance(value, (int, float)):
-                        status = "[red]HIGH[/red]" if value > threshold else "[green]OK[/green]"
+                if metric_type == "performance" and is_usage:
+                    threshold = "80%"
+                    if isinstance(value, (int, float)):
+                        status = "[red]HIGH[/red]" if value > 80 else "[green]OK[/green]"
                     else:
                         status = "[green]OK[/green]"
                 else:
@@ -624,9 +800,9 @@ def metrics(
                     status = "[green]OK[/green]"
                 
                 metric_table.add_row(
-                    metric_name.replace("_", " ").title(),
-                    str(value) + ("%" if "usage" in metric_name or "rate" in metric_name else ""),
-                    str(threshold) + ("%" if isinstance(threshold, (int, float)) and "usage" in metric_name else ""),
+                    title,
+                    str(value) + ("%" if is_usage or is_rate else ""),
+                    threshold,
                     status
                 )
             
@@ -647,20 +823,8 @@ def history(
     console.print(f"[dim]Last {hours} hours[/dim]\n")
     
     # Mock historical data
-    historical_data = []
     base_time = datetime.now()
-    
-    for i in range(hours):
-        timestamp = base_time - timedelta(hours=i)
-        historical_data.append({
-            "timestamp": timestamp.strftime("%H:%M"),
-            "cpu_usage": 45 + (i % 20) - 10,
-            "memory_usage": 60 + (i % 15) - 7,
-            "response_time": 80 + (i % 30) - 15,
-            "error_rate": max(0, 0.1 + (i % 5) * 0.02)
-        })
-    
-    historical_data.reverse()  # Show chronological order
+    hours_ago, historical_data = _synthetic_history(hours)
     
     # Create trend table
     trend_table = Table(title=f"Metrics Trend - Last {hours} Hours")
@@ -671,15 +835,13 @@ def history(
     trend_table.add_column("Error Rate %", style="red")
     
     # Show recent data points (last 10)
-    recent_data = historical_data[-10:] if len(historical_data) > 10 else historical_data
-    
-    for data_point in recent_data:
+    for offset, (cpu, memory, response, error) in zip(hours_ago[-10:], historical_data[-10:]):
         trend_table.add_row(
-            data_point["timestamp"],
-            f"{data_point['cpu_usage']:.1f}",
-            f"{data_point['memory_usage']:.1f}",
-            f"{data_point['response_time']:.1f}",
-            f"{data_point['error_rate']:.2f}"
+            (base_time - timedelta(hours=offset)).strftime("%H:%M"),
+            f"{cpu:.1f}",
+            f"{memory:.1f}",
+            f"{response:.1f}",
+            f"{error:.2f}"
         )
     
     console.print(trend_table)
@@ -693,35 +855,18 @@ def history(
     summary_table.add_column("Peak", style="yellow")
     summary_table.add_column("Minimum", style="blue")
     
-    # Calculate stats
-    cpu_values = [d["cpu_usage"] for d in historical_data]
-    memory_values = [d["memory_usage"] for d in historical_data]
-    response_values = [d["response_time"] for d in historical_data]
-    error_values = [d["error_rate"] for d in historical_data]
-    
-    summary_table.add_row(
-        "CPU Usage (%)",
-        f"{sum(cpu_values)/len(cpu_values):.1f}",
-        f"{max(cpu_values):.1f}",
-        f"{min(cpu_values):.1f}"
-    )
-    summary_table.add_row(
-        "Memory Usage (%)",
-        f"{sum(memory_values)/len(memory_values):.1f}",
-        f"{max(memory_values):.1f}",
-        f"{min(memory_values):.1f}"
-    )
-    summary_table.add_row(
-        "Response Time (ms)",
-        f"{sum(response_values)/len(response_values):.1f}",
-        f"{max(response_values):.1f}",
-        f"{min(response_values):.1f}"
-    )
-    summary_table.add_row(
-        "Error Rate (%)",
-        f"{sum(error_values)/len(error_values):.2f}",
-        f"{max(error_values):.2f}",
-        f"{min(error_values):.2f}"
-    )
+    # Calculate stats per column, transposing the rows once
+    for values, (label, precision) in zip(zip(*historical_data), (
+        ("CPU Usage (%)", 1),
+        ("Memory Usage (%)", 1),
+        ("Response Time (ms)", 1),
+        ("Error Rate (%)", 2),
+    )):
+        summary_table.add_row(
+            label,
+            f"{sum(values) / len(values):.{precision}f}",
+            f"{max(values):.{precision}f}",
+            f"{min(values):.{precision}f}"
+        )
     
     console.print(summary_table)
\ No newline at end of file
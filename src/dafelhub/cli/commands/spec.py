@@ -3,13 +3,11 @@ DafelHub Spec Command
 Manage specifications using Spec-Driven Development principles.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
 
 from dafelhub.core.logging import get_logger
 from dafelhub.services.spec_manager import SpecManager
@@ -20,6 +18,23 @@ console = Console()
 
 app = typer.Typer(help="Manage specifications and requirements")
 
+# (header, style) pairs for the list_specs table
+_SPEC_COLUMNS = (
+    ("Name", "cyan"),
+    ("Type", "green"),
+    ("Status", "yellow"),
+    ("Priority", "red"),
+    ("Last Modified", "dim"),
+)
+
+
+@lru_cache(maxsize=1)
+def _spec_manager() -> SpecManager:
+    """
+    Shared SpecManager instance, created on first use
+    """
+    return SpecManager()
+
 
 @app.command()
 def create(
@@ -39,11 +54,19 @@ def create(
     """
     📝 Create a new specification
     """
-    console.print(f"[bold blue]Creating specification:[/bold blue] {name}")
+    from rich.panel import Panel
+    
+    header = f"[bold blue]Creating specification:[/bold blue] {name}"
+    # Renderables held back until the result panel is printed
+    pending = []
     
-    spec_manager = SpecManager()
+    spec_manager = _spec_manager()
     
     if interactive:
+        from rich.prompt import Prompt
+        
+        console.print(header)
+        
         # Interactive specification creation
         description = Prompt.ask("Brief description of the feature/requirement")
         
@@ -58,11 +81,6 @@ def create(
             default="medium"
         )
         
-        use_ai_assistant = Confirm.ask(
-            "Use AI assistant to enhance specification?",
-            default=True
-        )
-        
         spec_data = {
             "name": name,
             "type": feature_type,
@@ -70,16 +88,9 @@ def create(
             "stakeholders": [s.strip() for s in stakeholders.split(",")],
             "priority": priority,
         }
-        
-        if use_ai_assistant:
-            console.print("[yellow]AI Assistant is analyzing your requirements...[/yellow]")
-            # TODO: Implement SpecAgent integration
-            # spec_agent = SpecAgent()
-            # enhanced_spec = spec_agent.enhance_specification(spec_data)
-            # spec_data.update(enhanced_spec)
-            console.print("[yellow]AI Assistant feature coming soon![/yellow]")
     
     else:
+        pending.append(header)
         spec_data = {
             "name": name,
             "type": feature_type,
@@ -91,7 +102,7 @@ def create(
     try:
         spec_path = spec_manager.create_specification(spec_data)
         
-        console.print(Panel(
+        console.print(*pending, Panel(
             f"[green]✓[/green] Specification '{name}' created!\n"
             f"[dim]Location: {spec_path}[/dim]\n\n"
             f"[bold]Next steps:[/bold]\n"
@@ -104,7 +115,10 @@ def create(
         
     except Exception as e:
         logger.error(f"Failed to create specification: {e}")
-        console.print(f"[red]Error:[/red] {e}")
+        # Show the deferred header so the error keeps its context
+        if pending:
+            console.print(*pending)
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
 
 
@@ -120,10 +134,13 @@ def review(
     """
     🔍 Review specification quality and completeness
     """
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    
     console.print(f"[bold blue]Reviewing specification:[/bold blue] {name}")
     
     try:
-        spec_manager = SpecManager()
+        spec_manager = _spec_manager()
         # TODO: Implement SpecAgent
         # spec_agent = SpecAgent()
         
@@ -160,7 +177,7 @@ def review(
                 
     except Exception as e:
         logger.error(f"Failed to review specification: {e}")
-        console.print(f"[red]Error:[/red] {e}")
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
 
 
@@ -177,7 +194,7 @@ def list_specs(
     📋 List all specifications
     """
     try:
-        spec_manager = SpecManager()
+        spec_manager = _spec_manager()
         specs = spec_manager.list_specifications(status_filter=status)
         
         if not specs:
@@ -187,11 +204,8 @@ def list_specs(
         from rich.table import Table
         
         table = Table(title="Specifications")
-        table.add_column("Name", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Status", style="yellow")
-        table.add_column("Priority", style="red")
-        table.add_column("Last Modified", style="dim")
+        for column, style in _SPEC_COLUMNS:
+            table.add_column(column, style=style)
         
         for spec in specs:
             table.add_row(
@@ -206,7 +220,7 @@ def list_specs(
         
     except Exception as e:
         logger.error(f"Failed to list specifications: {e}")
-        console.print(f"[red]Error:[/red] {e}")
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
 
 
@@ -222,8 +236,10 @@ def approve(
     """
     ✅ Approve a specification
     """
+    from rich.panel import Panel
+    
     try:
-        spec_manager = SpecManager()
+        spec_manager = _spec_manager()
         spec_manager.approve_specification(name, approver)
         
         console.print(Panel(
@@ -235,5 +251,5 @@ def approve(
         
     except Exception as e:
         logger.error(f"Failed to approve specification: {e}")
-        console.print(f"[red]Error:[/red] {e}")
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
\ No newline at end of file
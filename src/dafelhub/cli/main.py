@@ -2,36 +2,82 @@
 DafelHub CLI Main Entry Point
 """
 
+import importlib
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import typer
+from typer.core import TyperGroup
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
 from dafelhub import __version__
-from dafelhub.core.config import settings
-from dafelhub.core.logging import get_logger
-from dafelhub.cli.commands import init, check, spec, plan, deploy, monitor
 
-logger = get_logger(__name__)
 console = Console()
 
+# Command groups living in dafelhub.cli.commands, imported only when used
+LAZY_COMMANDS = {
+    "init": "Initialize new projects and services",
+    "spec": "Manage specifications and requirements",
+    "plan": "Create and manage project plans",
+    "deploy": "Deploy services and infrastructure",
+    "monitor": "Monitor system health and metrics",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_command(name: str) -> Any:
+    """
+    Import a command module and build its click group, once per process
+    """
+    module = importlib.import_module(f"dafelhub.cli.commands.{name}")
+    # get_group, unlike get_command, adds no --install-completion/--show-completion
+    command = typer.main.get_group(module.app)
+    command.name = name
+    command.help = LAZY_COMMANDS[name]
+    return command
+
+
+@lru_cache(maxsize=None)
+def _stub_command(name: str) -> Any:
+    """
+    Placeholder with a command's name and help, for listings that must not import it
+    """
+    return TyperGroup(name=name, help=LAZY_COMMANDS[name])
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Root command group that imports command modules on first use
+    """
+    
+    def list_commands(self, ctx: Any) -> List[str]:
+        return [*LAZY_COMMANDS, *super().list_commands(ctx)]
+    
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        # Help and completion listings only need the name and short help
+        if cmd_name in LAZY_COMMANDS:
+            return _stub_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def resolve_command(self, ctx: Any, args: List[str]) -> Tuple[Optional[str], Any, List[str]]:
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if cmd_name in LAZY_COMMANDS:
+            command = _load_command(cmd_name)
+        return cmd_name, command, args
+
+
 app = typer.Typer(
     name="dafelhub",
     help="DafelHub - Enterprise SaaS Consulting Hub CLI",
+    cls=LazyCommandGroup,
     rich_markup_mode="rich",
     no_args_is_help=True,
 )
 
-app.add_typer(init.app, name="init", help="Initialize new projects and services")
-app.add_typer(spec.app, name="spec", help="Manage specifications and requirements") 
-app.add_typer(plan.app, name="plan", help="Create and manage project plans")
-app.add_typer(deploy.app, name="deploy", help="Deploy services and infrastructure")
-app.add_typer(monitor.app, name="monitor", help="Monitor system health and metrics")
-
 
 @app.callback()
 def main(
@@ -57,8 +103,10 @@ def main(
         raise typer.Exit()
     
     if verbose:
-        settings.LOG_LEVEL = "DEBUG"
-        logger.info("Verbose logging enabled")
+        from dafelhub.core.logging import get_logger, set_log_level
+        
+        set_log_level("DEBUG")
+        get_logger(__name__).info("Verbose logging enabled")
 
 
 @app.command()
@@ -73,6 +121,8 @@ def check(
     """
     🔍 Check project health and configuration
     """
+    from dafelhub.core.config import settings
+    
     console.print(Panel(
         f"[bold green]✓[/bold green] DafelHub v{__version__} is working correctly!\n"
         f"[dim]Project path: {project_path}[/dim]\n"
@@ -87,6 +137,8 @@ def info() -> None:
     """
     📊 Show system information and status
     """
+    from dafelhub.core.config import settings
+    
     info_text = Text()
     info_text.append("DafelHub Enterprise SaaS Platform\n", style="bold blue")
     info_text.append(f"Version: {__version__}\n", style="green")
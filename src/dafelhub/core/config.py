@@ -92,9 +92,11 @@ class Settings(BaseSettings):
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: Any) -> List[str]:
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
+        # Accept "a, b" as well as '["a", "b"]'; blank entries are dropped
+        if isinstance(v, str):
+            origins = (i.strip().strip("'\"") for i in v.strip().strip("[]").split(","))
+            return [origin for origin in origins if origin]
+        elif isinstance(v, list):
             return v
         raise ValueError(v)
     
@@ -109,14 +111,13 @@ class Settings(BaseSettings):
     @field_validator("UPLOAD_PATH", mode="before")
     @classmethod
     def ensure_upload_path(cls, v: Any) -> Path:
-        path = Path(v) if not isinstance(v, Path) else v
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return Path(v) if not isinstance(v, Path) else v
     
     model_config = SettingsConfigDict(
         case_sensitive=True,
         env_file=".env",
-        env_file_encoding="utf-8"
+        env_file_encoding="utf-8",
+        frozen=True
     )
 
 
@@ -128,5 +129,15 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache()
+def get_upload_path() -> Path:
+    """
+    Get the upload directory, creating it on first use
+    """
+    path = get_settings().UPLOAD_PATH
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 # Global settings instance
 settings = get_settings()
\ No newline at end of file
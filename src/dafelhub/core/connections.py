@@ -4,12 +4,17 @@ Enterprise connection management adapted from Dafel-Technologies
 """
 
 import asyncio
+import logging
+import random
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
-import uuid
+from datetime import datetime, timezone
+from enum import StrEnum
+from functools import cached_property
+from typing import Any, Deque, Dict, List, Optional, Set, Union
+import secrets
 import time
 import json
 from concurrent.futures import ThreadPoolExecutor
@@ -19,8 +24,21 @@ from dafelhub.core.config import settings
 
 logger = get_logger(__name__)
 
+# Seconds between health check rounds
+HEALTH_CHECK_INTERVAL = 30
 
-class ConnectionType(Enum):
+# Dedicated generator for retry jitter
+_retry_random = random.Random()
+
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(_UTC)
+
+
+class ConnectionType(StrEnum):
     """Supported connection types"""
     POSTGRESQL = "postgresql"
     MYSQL = "mysql"
@@ -32,7 +50,7 @@ class ConnectionType(Enum):
     SQLITE = "sqlite"
 
 
-class ConnectionStatus(Enum):
+class ConnectionStatus(StrEnum):
     """Connection status states"""
     DISCONNECTED = "disconnected"
     CONNECTING = "connecting"
@@ -43,7 +61,7 @@ class ConnectionStatus(Enum):
     UNHEALTHY = "unhealthy"
 
 
-class ConnectionErrorType(Enum):
+class ConnectionErrorType(StrEnum):
     """Connection error types"""
     AUTHENTICATION_FAILED = "authentication_failed"
     CONNECTION_REFUSED = "connection_refused"
@@ -72,11 +90,17 @@ class ConnectionConfig:
     query_timeout: int = 60000
     retry_attempts: int = 3
     retry_delay: int = 1000
+    retry_delay_cap: int = 30000
     configuration: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+
+    @cached_property
+    def log_context(self) -> Dict[str, Any]:
+        """Static log fields for this connection, built once"""
+        return {"connection_id": self.id, "type": self.type}
 
 
 @dataclass 
@@ -116,7 +140,7 @@ class ConnectionError(Exception):
         self.error_type = error_type
         self.code = code
         self.context = context or {}
-        self.timestamp = datetime.now()
+        self.timestamp = _now()
 
 
 class IDataSourceConnector(ABC):
@@ -161,17 +185,32 @@ class ConnectionPool(LoggerMixin):
         self.config = config
         self.max_size = max_size
         self.min_size = min_size
-        self._pool: Set[IDataSourceConnector] = set()
+        # Idle connectors, reused LIFO so the most recently used one goes first
+        self._pool: Deque[IDataSourceConnector] = deque()
         self._active: Set[IDataSourceConnector] = set()
         self._lock = asyncio.Lock()
-        self._created_at = datetime.now()
+        self._created_at = _now()
         
     async def acquire(self) -> IDataSourceConnector:
         """Acquire connection from pool"""
+        # Fast path: reuse an idle connector. Deque and set mutations
+        # without an await in between are atomic on the event loop.
+        try:
+            connector = self._pool.pop()
+        except IndexError:
+            pass
+        else:
+            self._active.add(connector)
+            return connector
+        
+        # Slow path: the lock only serializes growth of the pool
         async with self._lock:
-            # Try to get from pool
-            if self._pool:
+            # A connector may have been released while waiting for the lock
+            try:
                 connector = self._pool.pop()
+            except IndexError:
+                pass
+            else:
                 self._active.add(connector)
                 return connector
             
@@ -189,15 +228,15 @@ class ConnectionPool(LoggerMixin):
     
     async def release(self, connector: IDataSourceConnector) -> None:
         """Release connection back to pool"""
-        async with self._lock:
-            if connector in self._active:
-                self._active.remove(connector)
-                
-                # Add back to pool if under min size
-                if len(self._pool) < self.min_size:
-                    self._pool.add(connector)
-                else:
-                    await connector.disconnect()
+        if connector not in self._active:
+            return
+        self._active.remove(connector)
+        
+        # Add back to pool if under min size
+        if len(self._pool) < self.min_size:
+            self._pool.append(connector)
+        else:
+            await connector.disconnect()
     
     async def _create_connection(self) -> IDataSourceConnector:
         """Create new connection"""
@@ -209,11 +248,13 @@ class ConnectionManager(LoggerMixin):
     """Enterprise Connection Manager - Singleton"""
     
     _instance: Optional['ConnectionManager'] = None
-    _lock = asyncio.Lock()
+    _instance_lock = threading.Lock()
     
     def __new__(cls) -> 'ConnectionManager':
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(self):
@@ -223,31 +264,35 @@ class ConnectionManager(LoggerMixin):
         self._connections: Dict[str, IDataSourceConnector] = {}
         self._pools: Dict[str, ConnectionPool] = {}
         self._metadata: Dict[str, ConnectionMetadata] = {}
-        self._health_tasks: Dict[str, asyncio.Task] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        # First checks of connections registered while the shared task sleeps
+        self._initial_checks: Set[asyncio.Task] = set()
         self._is_shutting_down = False
-        self._executor = ThreadPoolExecutor(max_workers=10)
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._initialized = True
         
         self.logger.info("ConnectionManager initialized")
     
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for blocking work, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=10)
+        return self._executor
+    
     @classmethod
     async def get_instance(cls) -> 'ConnectionManager':
         """Get singleton instance"""
-        if cls._instance is None:
-            async with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        return cls()
     
     async def create_connection(self, config: ConnectionConfig) -> IDataSourceConnector:
         """Create new connection"""
-        start_time = time.time()
-        correlation_id = str(uuid.uuid4())
+        start_time = time.perf_counter()
+        correlation_id = secrets.token_hex(8)
         
         try:
-            self.logger.info(f"Creating connection: {config.id}", extra_data={
-                "connection_id": config.id,
-                "type": config.type.value,
+            self.log_with_context(logging.INFO, f"Creating connection: {config.id}", {
+                **config.log_context,
                 "correlation_id": correlation_id
             })
             
@@ -262,26 +307,32 @@ class ConnectionManager(LoggerMixin):
             connector = await self._create_connector(config)
             
             # Connect with retry
-            await self._connect_with_retry(connector, config.retry_attempts)
+            await self._connect_with_retry(
+                connector,
+                config.retry_attempts,
+                base_delay=config.retry_delay / 1000,
+                max_delay=config.retry_delay_cap / 1000
+            )
             
             # Register
             self._connections[config.id] = connector
             self._metadata[config.id] = ConnectionMetadata(
-                connected_at=datetime.now(),
+                connected_at=_now(),
                 is_healthy=True
             )
             
             # Start health monitoring
             await self._start_health_monitoring(config.id)
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.info(f"Connection created: {config.id} ({duration:.2f}s)")
             
             return connector
             
         except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"Failed to create connection: {config.id}", extra_data={
+            duration = time.perf_counter() - start_time
+            self.log_with_context(logging.ERROR, f"Failed to create connection: {config.id}", {
+                **config.log_context,
                 "error": str(e),
                 "duration": duration,
                 "correlation_id": correlation_id
@@ -299,11 +350,6 @@ class ConnectionManager(LoggerMixin):
             return
             
         try:
-            # Stop health monitoring
-            if connection_id in self._health_tasks:
-                self._health_tasks[connection_id].cancel()
-                del self._health_tasks[connection_id]
-            
             # Disconnect
             await connector.disconnect()
             
@@ -319,7 +365,7 @@ class ConnectionManager(LoggerMixin):
             self.logger.info(f"Connection closed: {connection_id}")
             
         except Exception as e:
-            self.logger.error(f"Error closing connection: {connection_id}", extra_data={
+            self.log_with_context(logging.ERROR, f"Error closing connection: {connection_id}", {
                 "error": str(e)
             })
             raise
@@ -335,7 +381,7 @@ class ConnectionManager(LoggerMixin):
             metadata = self._metadata.get(connection_id)
             if metadata:
                 metadata.is_healthy = is_healthy
-                metadata.last_activity = datetime.now()
+                metadata.last_activity = _now()
             return is_healthy
         except Exception as e:
             self.logger.error(f"Health check failed: {connection_id}", extra_data={
@@ -352,16 +398,23 @@ class ConnectionManager(LoggerMixin):
         self.logger.info("ConnectionManager shutting down...")
         
         try:
-            # Cancel health tasks
-            for task in self._health_tasks.values():
+            # Stop health monitoring
+            if self._health_task is not None:
+                self._health_task.cancel()
+                self._health_task = None
+            for task in self._initial_checks:
                 task.cancel()
             
-            # Close all connections
-            for connection_id in list(self._connections.keys()):
-                await self.close_connection(connection_id)
+            # Close all connections concurrently; failures are logged by close_connection
+            await asyncio.gather(
+                *(self.close_connection(connection_id) for connection_id in tuple(self._connections)),
+                return_exceptions=True
+            )
                 
-            # Shutdown executor
-            self._executor.shutdown(wait=True)
+            # Shutdown executor if it was ever started
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
             
             self.logger.info("ConnectionManager shutdown complete")
         except Exception as e:
@@ -373,8 +426,14 @@ class ConnectionManager(LoggerMixin):
         # For now, raise not implemented
         raise NotImplementedError(f"Connector for {config.type} not implemented yet")
     
-    async def _connect_with_retry(self, connector: IDataSourceConnector, max_retries: int) -> None:
-        """Connect with retry logic"""
+    async def _connect_with_retry(
+        self,
+        connector: IDataSourceConnector,
+        max_retries: int,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0
+    ) -> None:
+        """Connect with retry logic (capped exponential backoff, full jitter)"""
         for attempt in range(max_retries + 1):
             try:
                 await connector.connect()
@@ -385,25 +444,39 @@ class ConnectionManager(LoggerMixin):
                 self.logger.warn(f"Connection attempt {attempt + 1} failed, retrying...", extra_data={
                     "error": str(e)
                 })
-                await asyncio.sleep(1.0 * (2 ** attempt))  # Exponential backoff
+                # Jitter keeps concurrent reconnects from retrying in lockstep
+                delay = _retry_random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+                await asyncio.sleep(delay)
     
     async def _start_health_monitoring(self, connection_id: str) -> None:
-        """Start health monitoring task"""
-        async def health_monitor():
-            while not self._is_shutting_down and connection_id in self._connections:
-                try:
-                    await self.health_check(connection_id)
-                    await asyncio.sleep(30)  # Check every 30 seconds
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    self.logger.error(f"Health monitor error: {connection_id}", extra_data={
-                        "error": str(e)
-                    })
-                    await asyncio.sleep(5)
+        """Ensure the shared health monitoring task is running"""
+        if self._health_task is None or self._health_task.done():
+            # A new task checks every connection, this one included, before it first sleeps
+            self._health_task = asyncio.create_task(self._health_monitor())
+            return
         
-        task = asyncio.create_task(health_monitor())
-        self._health_tasks[connection_id] = task
+        # The running task may be mid-sleep; check the new connection now
+        task = asyncio.create_task(self.health_check(connection_id))
+        self._initial_checks.add(task)
+        task.add_done_callback(self._initial_checks.discard)
+    
+    async def _health_monitor(self) -> None:
+        """Check all registered connections concurrently on a single timer"""
+        while not self._is_shutting_down and self._connections:
+            try:
+                connection_ids = tuple(self._connections)
+                await asyncio.gather(
+                    *(self.health_check(connection_id) for connection_id in connection_ids),
+                    return_exceptions=True
+                )
+                await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error("Health monitor error", extra_data={
+                    "error": str(e)
+                })
+                await asyncio.sleep(5)
 
 
 # Singleton instance
@@ -4,7 +4,7 @@ Banking-grade AES-256-GCM encryption system with military precision
 Migrated from Dafel-Technologies VaultManager.ts (472 lines)
 Implements all enterprise features:
 - AES-256-GCM authenticated encryption
-- PBKDF2 key derivation (100,000 iterations)
+- HKDF-SHA256 per-message key derivation (PBKDF2 for legacy packages and passwords)
 - Automatic key rotation with versioning
 - Secure memory wiping
 - HMAC signature verification
@@ -13,6 +13,9 @@ Implements all enterprise features:
 - Comprehensive audit trail
 """
 
+import asyncio
+import ctypes
+import ctypes.util
 import os
 import json
 import base64
@@ -22,20 +25,95 @@ import hmac
 import threading
 import time
 import re
+import struct
+import tempfile
 import uuid
-from typing import Dict, Any, Optional, List, Union
+from collections import OrderedDict, deque
+from typing import BinaryIO, Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from dafelhub.core.logging import get_logger, LoggerMixin
-from dafelhub.core.config import settings
+from dafelhub.core.config import get_upload_path, settings
 
 logger = get_logger(__name__)
 
+# Guards creation of the module-level EnterpriseVaultManager
+_singleton_lock = threading.Lock()
+
+# JSON codec for plaintexts and legacy packages; orjson emits UTF-8 bytes directly
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# Derived keys are cached per (master key, salt) so repeated decrypts of the
+# same package skip the 100k-iteration PBKDF2 run
+_DERIVED_KEY_CACHE_SIZE = 1024
+_DERIVED_KEY_TTL = 300.0
+
+# Per-message key derivation schemes recorded in EncryptedData.kdf. The master
+# key is already 32 uniform bytes, so new packages use a single HKDF pass;
+# PBKDF2 stretching is only kept to read packages written before it.
+_KDF_PBKDF2 = 'pbkdf2-sha256'
+_KDF_HKDF = 'hkdf-sha256'
+_HKDF_INFO = b"vault-v2"
+_KDF_IDS = {_KDF_PBKDF2: 0, _KDF_HKDF: 1}
+_KDF_NAMES = {kdf_id: name for name, kdf_id in _KDF_IDS.items()}
+
+# Binary package envelope, base64 encoded once:
+#   magic(1) | kdf_id(1) | key_version(4) | salt(64) | iv(16) | ciphertext | tag(16)
+# The header before the IV is authenticated as associated data. Legacy packages
+# are base64 JSON and so never start with the magic byte.
+_ENVELOPE_MAGIC = b"\x01"
+_ENVELOPE_HEADER = struct.Struct(">cBI64s")
+_IV_SIZE = 16
+_TAG_SIZE = 16
+_ENVELOPE_MIN_SIZE = _ENVELOPE_HEADER.size + _IV_SIZE + _TAG_SIZE
+# Shortest base64 text of a package; both package forms are padded to a multiple of 4
+_ENCODED_MIN_SIZE = 4 * -(-_ENVELOPE_MIN_SIZE // 3)
+
+# Streamed files share the envelope header under their own magic byte, followed
+# by the IV, the ciphertext written in chunks and the tag last. Base64 text
+# packages never start with this byte.
+_STREAM_MAGIC = b"\x02"
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Sensitive connection string fields - matching TypeScript patterns
+_CONN_PATTERNS = [
+    (re.compile(r'password=([^;]*)', re.IGNORECASE), 'password=***'),
+    (re.compile(r'pwd=([^;]*)', re.IGNORECASE), 'pwd=***'),
+    (re.compile(r'apikey=([^;]*)', re.IGNORECASE), 'apikey=***'),
+    (re.compile(r'secret=([^;]*)', re.IGNORECASE), 'secret=***'),
+    (re.compile(r':([^:@]+)@', re.IGNORECASE), ':***@'),  # MongoDB style
+]
+
+# Statement separators, comment markers and keywords stripped from SQL input
+_SQL_STRIP = re.compile(r";|--|/\*|\*/|xp_|exec|drop|union", re.IGNORECASE)
+
+# AES-GCM throughput floor; hardware AES (AES-NI, ARMv8 CE) builds run several times faster
+_MIN_AESGCM_THROUGHPUT = 500 * 1024 * 1024
+_BENCH_SIZE = 1024 * 1024
+# OPENSSL_ia32cap bit that advertises AES-NI to OpenSSL
+_IA32CAP_AESNI_BIT = 1 << 57
+
 
 class EncryptionError(Exception):
     """Encryption-related errors"""
@@ -55,13 +133,14 @@ class EncryptionConfig:
 
 @dataclass
 class EncryptedData:
-    """Encrypted data structure matching TypeScript interface"""
+    """Legacy JSON package structure matching TypeScript interface"""
     encrypted: str
     iv: str
     tag: str
     salt: str
     algorithm: str
     version: int
+    kdf: str = _KDF_PBKDF2
 
 
 @dataclass
@@ -72,13 +151,106 @@ class KeyRotationConfig:
     keep_old_keys: int = 3
 
 
+def _cpu_has_aes() -> Optional[bool]:
+    """Whether the CPU advertises AES instructions, or None when unknown"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                # "flags" on x86, "Features" on ARMv8
+                if line.startswith(('flags', 'Features')):
+                    return 'aes' in line.split(':', 1)[1].split()
+    except OSError:
+        pass
+    return None
+
+
+def _ia32cap_disables_aesni() -> bool:
+    """Whether OPENSSL_ia32cap turns off OpenSSL's AES-NI code path"""
+    value = os.getenv('OPENSSL_ia32cap')
+    if not value:
+        return False
+    
+    first = value.split(':', 1)[0]
+    try:
+        if first.startswith('~'):
+            return bool(int(first[1:], 0) & _IA32CAP_AESNI_BIT)
+        return not int(first, 0) & _IA32CAP_AESNI_BIT
+    except ValueError:
+        return False
+
+
+# libc mlock/munlock keep key pages out of swap; fallocate punches holes (Linux)
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+except (OSError, TypeError):
+    _libc = None
+_mlock = getattr(_libc, 'mlock', None)
+_munlock = getattr(_libc, 'munlock', None)
+_fallocate = getattr(_libc, 'fallocate', None)
+if _mlock is not None and _munlock is not None:
+    _mlock.argtypes = _munlock.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+else:
+    _mlock = _munlock = None
+if _fallocate is not None:
+    _fallocate.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong)
+
+_FALLOC_FL_KEEP_SIZE = 0x01
+_FALLOC_FL_PUNCH_HOLE = 0x02
+
+
+def _lock_memory(buffer: bytearray) -> None:
+    """Pin a key buffer in RAM; best effort, RLIMIT_MEMLOCK may refuse"""
+    if _mlock is not None and buffer:
+        _mlock(ctypes.addressof((ctypes.c_char * len(buffer)).from_buffer(buffer)), len(buffer))
+
+
+# Salts and IVs are sliced from one bulk CSPRNG draw instead of a getrandom call each
+_RANDOM_POOL_SIZE = 4096
+_random_lock = threading.Lock()
+_random_pool = b""
+_random_offset = 0
+
+
+def _random_bytes(n: int) -> bytes:
+    """Take n bytes from the CSPRNG pool, refilling it when exhausted"""
+    global _random_pool, _random_offset
+    if n > _RANDOM_POOL_SIZE:
+        return secrets.token_bytes(n)
+    with _random_lock:
+        if _random_offset + n > len(_random_pool):
+            _random_pool = secrets.token_bytes(_RANDOM_POOL_SIZE)
+            _random_offset = 0
+        start = _random_offset
+        _random_offset = start + n
+        return _random_pool[start:_random_offset]
+
+
+def _reset_random_pool() -> None:
+    """Discard the inherited pool so a forked child never reuses parent salts or IVs"""
+    global _random_lock, _random_pool, _random_offset
+    _random_lock = threading.Lock()
+    _random_pool = b""
+    _random_offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_pool)
+
+
+def _punch_hole(fd: int, length: int) -> bool:
+    """Deallocate a file's blocks so the filesystem can discard (TRIM) them"""
+    if _fallocate is None or not length:
+        return False
+    return _fallocate(fd, _FALLOC_FL_PUNCH_HOLE | _FALLOC_FL_KEEP_SIZE, 0, length) == 0
+
+
 class EnterpriseVaultManager(LoggerMixin):
     """
     Enterprise Vault Manager - Banking Grade Security
     Complete implementation of Dafel-Technologies VaultManager.ts
     Features:
     - AES-256-GCM authenticated encryption
-    - PBKDF2 key derivation with 100k iterations
+    - HKDF-SHA256 key derivation (PBKDF2 with 100k iterations for passwords)
     - Automatic key rotation with versioning
     - Secure memory wiping
     - HMAC signature verification
@@ -87,22 +259,8 @@ class EnterpriseVaultManager(LoggerMixin):
     - Comprehensive security audit trail
     """
     
-    _instance: Optional['EnterpriseVaultManager'] = None
-    _lock = threading.Lock()
-    
-    def __new__(cls) -> 'EnterpriseVaultManager':
-        """Singleton pattern with thread safety"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
         """Initialize Enterprise Vault Manager"""
-        if hasattr(self, '_initialized'):
-            return
-            
         super().__init__()
         
         # Configuration matching TypeScript implementation exactly
@@ -114,17 +272,25 @@ class EnterpriseVaultManager(LoggerMixin):
         )
         
         # Core encryption state - exactly matching TypeScript
-        self._master_key: Optional[bytes] = None
+        # Keys are mutable so _wipe_memory can zero them in place
+        self._master_key: Optional[bytearray] = None
         self._key_version: int = 1
-        self._old_keys: Dict[int, bytes] = {}
-        self._key_rotation_timer: Optional[threading.Timer] = None
+        self._old_keys: Dict[int, bytearray] = {}
+        # One long-lived rotation thread, signalled to stop through the event
+        self._key_rotation_thread: Optional[threading.Thread] = None
+        self._key_rotation_stop = threading.Event()
+        
+        # LRU of PBKDF2-derived keys by (key version, salt), with their expanded
+        # ciphers and monotonic expiry time
+        self._derived_keys: 'OrderedDict[Tuple[int, bytes], Tuple[bytearray, AESGCM, float]]' = OrderedDict()
+        self._derived_keys_lock = threading.Lock()
         
-        # Security tracking and audit trail
-        self._audit_log: List[Dict[str, Any]] = []
-        self._initialized = True
+        # Security tracking and audit trail; only the last 1000 events are kept
+        self._audit_log: 'deque[Dict[str, Any]]' = deque(maxlen=1000)
         
         # Initialize master key exactly like TypeScript version
         self._initialize_master_key()
+        self._aes_acceleration = self._verify_aes_acceleration()
         
         # Start key rotation if enabled
         if self.key_rotation_config.enabled:
@@ -139,7 +305,14 @@ class EnterpriseVaultManager(LoggerMixin):
     @classmethod
     def get_instance(cls) -> 'EnterpriseVaultManager':
         """Get singleton instance - matching TypeScript pattern"""
-        return cls()
+        global _enterprise_vault_manager
+        instance = _enterprise_vault_manager
+        if instance is None:
+            with _singleton_lock:
+                if _enterprise_vault_manager is None:
+                    _enterprise_vault_manager = cls()
+                instance = _enterprise_vault_manager
+        return instance
     
     def _initialize_master_key(self) -> None:
         """Initialize master key from environment or generate - exactly matching TypeScript"""
@@ -148,11 +321,13 @@ class EnterpriseVaultManager(LoggerMixin):
             
             if env_key:
                 # Use provided master key
-                key = bytes.fromhex(env_key)
+                key = bytearray.fromhex(env_key)
                 if len(key) != self.config.key_length:
+                    self._wipe_memory(key)
                     raise EncryptionError(
                         f"Invalid master key length. Expected {self.config.key_length} bytes, got {len(key)}"
                     )
+                _lock_memory(key)
                 self._master_key = key
                 self.logger.info("Master key loaded from environment")
             else:
@@ -160,54 +335,71 @@ class EnterpriseVaultManager(LoggerMixin):
                 if os.getenv('NODE_ENV') == 'production':
                     raise EncryptionError('ENCRYPTION_MASTER_KEY must be set in production')
                 
-                self._master_key = secrets.token_bytes(self.config.key_length)
-                self.logger.warning("Generated new master key for development", extra={
-                    "key": self._master_key.hex()
-                })
+                self._master_key = bytearray(secrets.token_bytes(self.config.key_length))
+                _lock_memory(self._master_key)
+                # The key itself is never logged; set ENCRYPTION_MASTER_KEY to keep data across restarts
+                self.logger.warning("Generated new master key for development")
                 
         except Exception as e:
             self.logger.error(f"Master key initialization failed: {e}")
             raise EncryptionError(f"Master key initialization failed: {e}")
     
+    def _verify_aes_acceleration(self) -> bool:
+        """Check that AES-GCM runs on hardware AES and warn when it does not"""
+        cpu_aes = _cpu_has_aes()
+        suppressed = _ia32cap_disables_aesni()
+        
+        aesgcm = AESGCM(AESGCM.generate_key(bit_length=256))
+        iv = secrets.token_bytes(self.config.iv_length)
+        block = bytes(_BENCH_SIZE)
+        
+        # Best of three so page faults on the first pass don't count
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            aesgcm.encrypt(iv, block, None)
+            best = min(best, time.perf_counter() - start)
+        throughput = _BENCH_SIZE / best
+        
+        if cpu_aes is False:
+            self.logger.warning("CPU does not report AES instructions; AES-GCM runs in software")
+        if suppressed:
+            self.logger.warning("OPENSSL_ia32cap masks out AES-NI; unset it to restore hardware AES")
+        if throughput < _MIN_AESGCM_THROUGHPUT:
+            self.logger.warning(
+                f"AES-GCM throughput is {throughput / (1024 * 1024):.0f} MiB/s; "
+                "the OpenSSL build may be no-asm and not using hardware AES"
+            )
+        
+        return cpu_aes is not False and not suppressed and throughput >= _MIN_AESGCM_THROUGHPUT
+    
     async def encrypt(self, plaintext: str) -> str:
         """
         Encrypt sensitive data with AES-256-GCM
-        Exactly matching TypeScript implementation logic
+        Returns the base64 encoded binary envelope
         """
+        # HKDF derivation is a couple of HMACs, so nothing here needs a thread
+        return self._sync_encrypt(plaintext.encode('utf-8'))
+    
+    def _sync_encrypt(self, plaintext: bytes) -> str:
+        """Encrypt without an event loop; shared by encrypt and encrypt_data"""
         try:
             if not self._master_key:
                 raise EncryptionError("Master key not available")
             
             # Generate salt for key derivation
-            salt = secrets.token_bytes(self.config.salt_length)
+            salt = _random_bytes(self.config.salt_length)
             
-            # Derive key from master key using PBKDF2
-            key = await self._derive_key(self._master_key, salt)
+            # Derive a per-message key from the master key
+            aesgcm = self._get_cipher_sync(self._key_version, salt, _KDF_HKDF)
             
             # Generate IV (16 bytes to match TypeScript)
-            iv = secrets.token_bytes(self.config.iv_length)
-            
-            # Create cipher and encrypt
-            aesgcm = AESGCM(key)
-            ciphertext = aesgcm.encrypt(iv, plaintext.encode('utf-8'), None)
-            
-            # Extract auth tag (last 16 bytes) - matching TypeScript separation
-            encrypted = ciphertext[:-self.config.tag_length]
-            tag = ciphertext[-self.config.tag_length:]
-            
-            # Create encrypted data object - exactly matching TypeScript structure
-            encrypted_data = EncryptedData(
-                encrypted=base64.b64encode(encrypted).decode('utf-8'),
-                iv=base64.b64encode(iv).decode('utf-8'),
-                tag=base64.b64encode(tag).decode('utf-8'),
-                salt=base64.b64encode(salt).decode('utf-8'),
-                algorithm=self.config.algorithm,
-                version=self._key_version
-            )
+            iv = _random_bytes(self.config.iv_length)
             
-            # Return as base64 encoded JSON - exactly matching TypeScript
-            json_str = json.dumps(asdict(encrypted_data))
-            result = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+            # Encrypt, authenticating the envelope header; the tag stays appended
+            header = _ENVELOPE_HEADER.pack(_ENVELOPE_MAGIC, _KDF_IDS[_KDF_HKDF], self._key_version, salt)
+            ciphertext = aesgcm.encrypt(iv, plaintext, header)
+            result = base64.b64encode(b"".join((header, iv, ciphertext))).decode('ascii')
             
             # Security audit logging
             self._log_security_event('encryption_success', {'version': self._key_version})
@@ -221,43 +413,82 @@ class EnterpriseVaultManager(LoggerMixin):
     async def decrypt(self, encrypted_string: str) -> str:
         """
         Decrypt sensitive data 
-        Exactly matching TypeScript implementation
+        Accepts binary envelopes and legacy base64 JSON packages
         """
         try:
             if not self._master_key:
                 raise EncryptionError("Master key not available")
             
-            # Parse encrypted data - exactly matching TypeScript parsing
-            encrypted_data_dict = json.loads(
-                base64.b64decode(encrypted_string.encode('utf-8')).decode('utf-8')
-            )
-            
-            # Get appropriate key based on version
-            master_key = self._get_key_for_version(encrypted_data_dict['version'])
-            
-            # Derive key from master key
-            salt = base64.b64decode(encrypted_data_dict['salt'].encode('utf-8'))
-            key = await self._derive_key(master_key, salt)
+            version, kdf, salt, iv, ciphertext, aad = self._parse_package(encrypted_string)
             
-            # Reconstruct ciphertext with tag
-            encrypted = base64.b64decode(encrypted_data_dict['encrypted'].encode('utf-8'))
-            tag = base64.b64decode(encrypted_data_dict['tag'].encode('utf-8'))
-            iv = base64.b64decode(encrypted_data_dict['iv'].encode('utf-8'))
+            # Legacy PBKDF2 packages derive in a worker thread
+            aesgcm = await self._get_cipher(version, salt, kdf)
+            return self._open(version, aesgcm, iv, ciphertext, aad)
             
-            ciphertext = encrypted + tag
-            
-            # Decrypt with AES-GCM
-            aesgcm = AESGCM(key)
-            decrypted = aesgcm.decrypt(iv, ciphertext, None)
+        except Exception as error:
+            raise self._decryption_error(error)
+    
+    def _sync_decrypt(self, encrypted_string: str) -> str:
+        """Decrypt without an event loop; used by decrypt_data"""
+        try:
+            if not self._master_key:
+                raise EncryptionError("Master key not available")
             
-            result = decrypted.decode('utf-8')
-            self._log_security_event('decryption_success', {'version': encrypted_data_dict['version']})
-            return result
+            version, kdf, salt, iv, ciphertext, aad = self._parse_package(encrypted_string)
+            aesgcm = self._get_cipher_sync(version, salt, kdf)
+            return self._open(version, aesgcm, iv, ciphertext, aad)
             
         except Exception as error:
-            self.logger.error(f"Decryption failed: {error}")
-            self._log_security_event('decryption_failed', {'error': str(error)})
-            raise EncryptionError('Failed to decrypt data')
+            raise self._decryption_error(error)
+    
+    def _open(self, version: int, aesgcm: AESGCM, iv: bytes, ciphertext: bytes, aad: Optional[bytes]) -> str:
+        """Authenticate and decrypt a parsed package"""
+        decrypted = aesgcm.decrypt(iv, ciphertext, aad)
+        
+        result = decrypted.decode('utf-8')
+        self._log_security_event('decryption_success', {'version': version})
+        return result
+    
+    def _decryption_error(self, error: Exception) -> EncryptionError:
+        """Log and audit a failed decryption"""
+        self.logger.error(f"Decryption failed: {error}")
+        self._log_security_event('decryption_failed', {'error': str(error)})
+        return EncryptionError('Failed to decrypt data')
+    
+    def _parse_package(self, encrypted_string: str) -> Tuple[int, str, bytes, bytes, bytes, Optional[bytes]]:
+        """Split a package into (version, kdf, salt, iv, ciphertext with tag, aad)"""
+        package = base64.b64decode(encrypted_string)
+        
+        if package[:1] == _ENVELOPE_MAGIC:
+            if len(package) < _ENVELOPE_MIN_SIZE:
+                raise EncryptionError("Truncated encrypted package")
+            _, kdf_id, version, salt = _ENVELOPE_HEADER.unpack_from(package)
+            if kdf_id not in _KDF_NAMES:
+                raise EncryptionError(f"Unsupported key derivation id: {kdf_id}")
+            # Views into the decoded package; AESGCM reads them without copies
+            view = memoryview(package)
+            iv_end = _ENVELOPE_HEADER.size + _IV_SIZE
+            return (
+                version,
+                _KDF_NAMES[kdf_id],
+                salt,
+                view[_ENVELOPE_HEADER.size:iv_end],
+                view[iv_end:],
+                view[:_ENVELOPE_HEADER.size],
+            )
+        
+        # Legacy base64 JSON envelope with separately encoded fields
+        encrypted_data_dict = _json_loads(package)
+        ciphertext = bytearray(base64.b64decode(encrypted_data_dict['encrypted']))
+        ciphertext += base64.b64decode(encrypted_data_dict['tag'])
+        return (
+            encrypted_data_dict['version'],
+            encrypted_data_dict.get('kdf', _KDF_PBKDF2),
+            base64.b64decode(encrypted_data_dict['salt']),
+            base64.b64decode(encrypted_data_dict['iv']),
+            ciphertext,
+            None,
+        )
     
     async def hash_password(self, password: str) -> str:
         """
@@ -265,7 +496,7 @@ class EnterpriseVaultManager(LoggerMixin):
         Exactly matching TypeScript bcrypt-compatible method
         """
         try:
-            salt = secrets.token_bytes(16)
+            salt = _random_bytes(16)
             iterations = 100000
             key_length = 32
             
@@ -274,11 +505,11 @@ class EnterpriseVaultManager(LoggerMixin):
                 algorithm=hashes.SHA256(),
                 length=key_length,
                 salt=salt,
-                iterations=iterations,
-                backend=default_backend()
+                iterations=iterations
             )
             
-            hash_bytes = kdf.derive(password.encode('utf-8'))
+            # 100k iterations take tens of milliseconds; keep them off the event loop
+            hash_bytes = await asyncio.to_thread(kdf.derive, password.encode('utf-8'))
             
             # Combine iterations, salt, and hash like TypeScript version
             combined = bytearray()
@@ -310,11 +541,10 @@ class EnterpriseVaultManager(LoggerMixin):
                 algorithm=hashes.SHA256(),
                 length=32,
                 salt=salt,
-                iterations=iterations,
-                backend=default_backend()
+                iterations=iterations
             )
             
-            new_hash = kdf.derive(password.encode('utf-8'))
+            new_hash = await asyncio.to_thread(kdf.derive, password.encode('utf-8'))
             
             # Timing-safe comparison - matching TypeScript crypto.timingSafeEqual
             return hmac.compare_digest(original_hash, new_hash)
@@ -327,6 +557,10 @@ class EnterpriseVaultManager(LoggerMixin):
         Rotate encryption keys
         Exactly matching TypeScript implementation
         """
+        self._rotate_keys()
+    
+    def _rotate_keys(self) -> None:
+        """Rotate keys without an event loop; shared by rotate_keys and the scheduler"""
         self.logger.info('Starting key rotation')
         
         try:
@@ -337,10 +571,12 @@ class EnterpriseVaultManager(LoggerMixin):
             if len(self._old_keys) > self.key_rotation_config.keep_old_keys:
                 oldest_version = min(self._old_keys.keys())
                 old_key = self._old_keys.pop(oldest_version)
+                self._clear_derived_keys(oldest_version)
                 self._wipe_memory(old_key)
             
             # Generate new master key
-            self._master_key = secrets.token_bytes(self.config.key_length)
+            self._master_key = bytearray(secrets.token_bytes(self.config.key_length))
+            _lock_memory(self._master_key)
             self._key_version += 1
             
             # Store new key securely (in production, use external key management)
@@ -364,37 +600,38 @@ class EnterpriseVaultManager(LoggerMixin):
             raise
     
     def _start_key_rotation(self) -> None:
-        """Start automatic key rotation - exactly matching TypeScript"""
-        interval_ms = self.key_rotation_config.interval_days * 24 * 60 * 60  # Convert to seconds
-        
-        def rotation_task():
-            try:
-                import asyncio
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.rotate_keys())
-                loop.close()
-            except Exception as e:
-                self.logger.error(f"Scheduled key rotation failed: {e}")
-            finally:
-                # Schedule next rotation
-                self._key_rotation_timer = threading.Timer(interval_ms, rotation_task)
-                self._key_rotation_timer.start()
+        """Start automatic key rotation on a daemon thread"""
+        interval = self.key_rotation_config.interval_days * 24 * 60 * 60  # seconds
+        self._key_rotation_stop.clear()
         
-        self._key_rotation_timer = threading.Timer(interval_ms, rotation_task)
-        self._key_rotation_timer.start()
+        # A thread outlives any event loop; a task on the loop that built the
+        # singleton would silently stop rotating once that loop closed
+        self._key_rotation_thread = threading.Thread(
+            target=self._rotation_worker, args=(interval,),
+            name='vault-key-rotation', daemon=True
+        )
+        self._key_rotation_thread.start()
         
         self.logger.info('Key rotation scheduled', extra={
             'interval_days': self.key_rotation_config.interval_days
         })
     
+    def _rotation_worker(self, interval: float) -> None:
+        """Thread body: rotate keys every interval seconds until stopped"""
+        while not self._key_rotation_stop.wait(interval):
+            try:
+                self._rotate_keys()
+            except Exception as e:
+                self.logger.error(f"Scheduled key rotation failed: {e}")
+    
     def stop_key_rotation(self) -> None:
         """Stop key rotation - exactly matching TypeScript"""
-        if self._key_rotation_timer:
-            self._key_rotation_timer.cancel()
-            self._key_rotation_timer = None
-            self.logger.info('Key rotation stopped')
+        if self._key_rotation_thread is None:
+            return
+        
+        self._key_rotation_thread = None
+        self._key_rotation_stop.set()
+        self.logger.info('Key rotation stopped')
     
     def generate_token(self, length: int = 32) -> str:
         """Generate secure random token - exactly matching TypeScript"""
@@ -421,17 +658,9 @@ class EnterpriseVaultManager(LoggerMixin):
         """
         result = connection_string
         
-        # Remove sensitive information from connection strings - matching TypeScript patterns
-        patterns = [
-            (r'password=([^;]*)', 'password=***'),
-            (r'pwd=([^;]*)', 'pwd=***'),
-            (r'apikey=([^;]*)', 'apikey=***'),
-            (r'secret=([^;]*)', 'secret=***'),
-            (r':([^:@]+)@', ':***@'),  # MongoDB style
-        ]
-        
-        for pattern, replacement in patterns:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        # Remove sensitive information from connection strings
+        for pattern, replacement in _CONN_PATTERNS:
+            result = pattern.sub(replacement, result)
         
         return result
     
@@ -443,45 +672,52 @@ class EnterpriseVaultManager(LoggerMixin):
         if not isinstance(input_str, str):
             return str(input_str)
         
-        # Basic SQL injection prevention - matching TypeScript patterns exactly
+        # Basic SQL injection prevention - matching TypeScript patterns
+        # One fused scan per round, repeated until stable so removals cannot
+        # splice a new token together
         result = input_str
-        result = result.replace("'", "''")
-        result = result.replace(";", "")
-        result = result.replace("--", "")
-        result = result.replace("/*", "")
-        result = result.replace("*/", "")
-        result = re.sub(r'xp_', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'exec', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'drop', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'union', '', result, flags=re.IGNORECASE)
+        removed = 1
+        while removed:
+            result, removed = _SQL_STRIP.subn('', result)
         
-        return result
+        # Quotes never form part of a stripped token, so escaping them last is equivalent
+        return result.replace("'", "''")
     
     def is_encrypted(self, value: str) -> bool:
         """
         Check if a value appears to be encrypted
-        Exactly matching TypeScript implementation
+        Recognizes binary envelopes and legacy JSON packages
         """
         try:
-            decoded = base64.b64decode(value.encode('utf-8')).decode('utf-8')
-            parsed = json.loads(decoded)
+            # Reject by length, then by the first decoded bytes, before decoding everything
+            if len(value) % 4 or len(value) < _ENCODED_MIN_SIZE:
+                return False
+            head = base64.b64decode(value[:4])
+            if head[:1] == _ENVELOPE_MAGIC:
+                # Padding drops one decoded byte per trailing '='
+                decoded_size = len(value) // 4 * 3 - value[-2:].count('=')
+                return decoded_size >= _ENVELOPE_MIN_SIZE and head[1] in _KDF_NAMES
+            if head[:1] != b'{':
+                return False
+            
+            parsed = _json_loads(base64.b64decode(value))
             
             required_fields = ['encrypted', 'iv', 'tag', 'salt', 'algorithm', 'version']
             return all(field in parsed for field in required_fields)
         except Exception:
             return False
     
-    def _wipe_memory(self, buffer: bytes) -> None:
+    def _wipe_memory(self, buffer: Optional[bytearray]) -> None:
         """
         Securely wipe sensitive data from memory
-        Matching TypeScript implementation intent (Python limitations noted)
+        Zeroes the buffer in place through memset and releases any mlock
         """
         if buffer:
-            # In TypeScript: crypto.randomFillSync(buffer); buffer.fill(0);
-            # Python limitation: bytes objects are immutable
-            # In production, consider using libraries like `mlock` or `sodium`
-            # For now, we rely on Python's garbage collection
-            pass
+            # TypeScript fills the Buffer; bytearrays expose their storage to ctypes
+            view = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+            ctypes.memset(view, 0, len(buffer))
+            if _munlock is not None:
+                _munlock(ctypes.addressof(view), len(buffer))
     
     def shutdown(self) -> None:
         """
@@ -498,9 +734,10 @@ class EnterpriseVaultManager(LoggerMixin):
             self._wipe_memory(key)
         
         self._old_keys.clear()
+        self._clear_derived_keys()
         self.logger.info('Vault Manager shutdown complete')
     
-    def _get_key_for_version(self, version: int) -> bytes:
+    def _get_key_for_version(self, version: int) -> bytearray:
         """Get key for specific version - exactly matching TypeScript"""
         if version == self._key_version:
             return self._master_key
@@ -511,37 +748,92 @@ class EnterpriseVaultManager(LoggerMixin):
         
         return old_key
     
-    async def _derive_key(self, master_key: bytes, salt: bytes) -> bytes:
+    async def _get_cipher(self, version: int, salt: bytes, kdf: str = _KDF_PBKDF2) -> AESGCM:
         """
-        Derive key from master key and salt
-        Exactly matching TypeScript async implementation
+        Get the AES-GCM cipher for a package's derived key
+        PBKDF2 misses run in a worker thread so they don't block the event loop
         """
+        if kdf == _KDF_PBKDF2 and self._cached_cipher(version, salt) is None:
+            return await asyncio.to_thread(self._get_cipher_sync, version, salt, kdf)
+        return self._get_cipher_sync(version, salt, kdf)
+    
+    def _get_cipher_sync(self, version: int, salt: bytes, kdf: str = _KDF_PBKDF2) -> AESGCM:
+        """Build a cipher for an HKDF key, or reuse the cached one for a PBKDF2 key"""
+        master_key = self._get_key_for_version(version)
+        if kdf != _KDF_PBKDF2:
+            return AESGCM(self._derive_key(master_key, salt, kdf))
+        
+        cached = self._cached_cipher(version, salt)
+        if cached is not None:
+            return cached
+        
+        derived = bytearray(self._derive_key(master_key, salt, kdf))
+        aesgcm = AESGCM(derived)
+        
+        with self._derived_keys_lock:
+            self._derived_keys[(version, bytes(salt))] = (
+                derived, aesgcm, time.monotonic() + _DERIVED_KEY_TTL
+            )
+            while len(self._derived_keys) > _DERIVED_KEY_CACHE_SIZE:
+                _, (evicted, _, _) = self._derived_keys.popitem(last=False)
+                self._wipe_memory(evicted)
+        return aesgcm
+    
+    def _derive_key(self, master_key: bytes, salt: bytes, kdf: str = _KDF_PBKDF2) -> bytes:
+        """HKDF for current packages, PBKDF2 for legacy ones"""
+        if kdf == _KDF_HKDF:
+            return HKDF(
+                algorithm=hashes.SHA256(),
+                length=self.config.key_length,
+                salt=salt,
+                info=_HKDF_INFO
+            ).derive(master_key)
+        if kdf != _KDF_PBKDF2:
+            raise EncryptionError(f"Unsupported key derivation: {kdf}")
+        
         # TypeScript uses crypto.pbkdf2 async - we simulate with PBKDF2HMAC
-        kdf = PBKDF2HMAC(
+        pbkdf2 = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=self.config.key_length,
             salt=salt,
-            iterations=self.config.iterations,
-            backend=default_backend()
+            iterations=self.config.iterations
         )
-        return kdf.derive(master_key)
+        return pbkdf2.derive(master_key)
+    
+    def _cached_cipher(self, version: int, salt: bytes) -> Optional[AESGCM]:
+        """Look up the cipher of an unexpired PBKDF2-derived key"""
+        cache_key = (version, bytes(salt))
+        with self._derived_keys_lock:
+            cached = self._derived_keys.get(cache_key)
+            if cached is None:
+                return None
+            key, aesgcm, expires = cached
+            if expires > time.monotonic():
+                self._derived_keys.move_to_end(cache_key)
+                return aesgcm
+            del self._derived_keys[cache_key]
+            self._wipe_memory(key)
+            return None
+    
+    def _clear_derived_keys(self, version: Optional[int] = None) -> None:
+        """Zero and drop cached derived keys, all of them or those of one key version"""
+        with self._derived_keys_lock:
+            stale = [k for k in self._derived_keys if version is None or k[0] == version]
+            for cache_key in stale:
+                key, _, _ = self._derived_keys.pop(cache_key)
+                self._wipe_memory(key)
     
     def _log_security_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Log security events for audit trail"""
-        event = {
+        self._audit_log.append({
             'timestamp': datetime.now().isoformat(),
             'event_type': event_type,
             'data': data
-        }
-        self._audit_log.append(event)
-        
-        # Keep only last 1000 events to prevent memory bloat
-        if len(self._audit_log) > 1000:
-            self._audit_log = self._audit_log[-1000:]
+        })
     
     def get_security_audit(self) -> List[Dict[str, Any]]:
         """Get security audit log"""
-        return self._audit_log.copy()
+        return list(self._audit_log)
     
     def get_vault_status(self) -> Dict[str, Any]:
         """Get comprehensive vault status"""
@@ -555,6 +847,7 @@ class EnterpriseVaultManager(LoggerMixin):
             'max_old_keys': self.key_rotation_config.keep_old_keys,
             'security_events_count': len(self._audit_log),
             'master_key_initialized': self._master_key is not None,
+            'aes_ni_enabled': self._aes_acceleration,
             'config': asdict(self.config),
             'rotation_config': asdict(self.key_rotation_config)
         }
@@ -562,32 +855,101 @@ class EnterpriseVaultManager(LoggerMixin):
     # Legacy compatibility methods for existing code
     def encrypt_data(self, data: Any, key_id: str = "default") -> str:
         """Legacy method for backward compatibility"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
         if isinstance(data, str):
-            return loop.run_until_complete(self.encrypt(data))
+            return self._sync_encrypt(data.encode('utf-8'))
         else:
-            return loop.run_until_complete(self.encrypt(json.dumps(data)))
+            return self._sync_encrypt(_json_dumps(data))
     
     def decrypt_data(self, encrypted_data: str) -> Any:
         """Legacy method for backward compatibility"""
-        import asyncio
+        return self._deserialize(self._sync_decrypt(encrypted_data))
+    
+    def encrypt_to_stream(self, data: Any, stream: BinaryIO) -> None:
+        """
+        Encrypt data into a binary stream chunk by chunk
+        
+        Args:
+            data: Data to encrypt; non-string values are stored as JSON
+            stream: Writable binary stream
+        """
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            if not self._master_key:
+                raise EncryptionError("Master key not available")
+            
+            plaintext = memoryview(data.encode('utf-8') if isinstance(data, str) else _json_dumps(data))
+            salt = _random_bytes(self.config.salt_length)
+            iv = _random_bytes(self.config.iv_length)
+            key = self._derive_key(self._master_key, salt, _KDF_HKDF)
+            
+            header = _ENVELOPE_HEADER.pack(_STREAM_MAGIC, _KDF_IDS[_KDF_HKDF], self._key_version, salt)
+            encryptor = Cipher(algorithms.AES(key), modes.GCM(iv)).encryptor()
+            encryptor.authenticate_additional_data(header)
+            
+            stream.write(header)
+            stream.write(iv)
+            for offset in range(0, len(plaintext), _STREAM_CHUNK_SIZE):
+                stream.write(encryptor.update(plaintext[offset:offset + _STREAM_CHUNK_SIZE]))
+            stream.write(encryptor.finalize())
+            stream.write(encryptor.tag)
+            
+            self._log_security_event('encryption_success', {'version': self._key_version})
+            
+        except Exception as error:
+            self.logger.error(f"Encryption failed: {error}")
+            self._log_security_event('encryption_failed', {'error': str(error)})
+            raise EncryptionError('Failed to encrypt data')
+    
+    def decrypt_from_stream(self, stream: BinaryIO) -> Any:
+        """
+        Decrypt data written by encrypt_to_stream
         
-        decrypted_str = loop.run_until_complete(self.decrypt(encrypted_data))
+        Args:
+            stream: Readable binary stream positioned at the package start
+            
+        Returns:
+            Decrypted data (JSON values parsed, other text as string)
+        """
+        try:
+            if not self._master_key:
+                raise EncryptionError("Master key not available")
+            
+            prefix = stream.read(_ENVELOPE_HEADER.size + _IV_SIZE)
+            if len(prefix) < _ENVELOPE_HEADER.size + _IV_SIZE or prefix[:1] != _STREAM_MAGIC:
+                raise EncryptionError("Truncated encrypted package")
+            _, kdf_id, version, salt = _ENVELOPE_HEADER.unpack_from(prefix)
+            if kdf_id not in _KDF_NAMES:
+                raise EncryptionError(f"Unsupported key derivation id: {kdf_id}")
+            
+            key = self._derive_key(self._get_key_for_version(version), salt, _KDF_NAMES[kdf_id])
+            decryptor = Cipher(algorithms.AES(key), modes.GCM(prefix[_ENVELOPE_HEADER.size:])).decryptor()
+            decryptor.authenticate_additional_data(prefix[:_ENVELOPE_HEADER.size])
+            
+            # Hold back the trailing tag until the stream ends
+            plaintext = bytearray()
+            pending = b""
+            while True:
+                chunk = stream.read(_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending += chunk
+                if len(pending) > _TAG_SIZE:
+                    plaintext += decryptor.update(pending[:-_TAG_SIZE])
+                    pending = pending[-_TAG_SIZE:]
+            if len(pending) < _TAG_SIZE:
+                raise EncryptionError("Truncated encrypted package")
+            plaintext += decryptor.finalize_with_tag(pending)
+            
+            self._log_security_event('decryption_success', {'version': version})
+            
+        except Exception as error:
+            raise self._decryption_error(error)
         
-        # Try to parse as JSON, fallback to string
+        return self._deserialize(plaintext.decode('utf-8'))
+    
+    def _deserialize(self, decrypted_str: str) -> Any:
+        """Parse decrypted text as JSON, falling back to the string"""
         try:
-            return json.loads(decrypted_str)
+            return _json_loads(decrypted_str)
         except json.JSONDecodeError:
             return decrypted_str
 
@@ -604,12 +966,21 @@ class EnterpriseSecureStorage(LoggerMixin):
     def store_connection_credentials(self, connection_id: str, credentials: Dict[str, Any]) -> None:
         """Store connection credentials securely with enterprise encryption"""
         try:
-            encrypted_creds = self.vault.encrypt_data(credentials)
+            # Store in secure location with enterprise naming, encrypted as it is written
+            storage_path = get_upload_path() / f"enterprise_credentials_{connection_id}.enc"
             
-            # Store in secure location with enterprise naming
-            storage_path = settings.UPLOAD_PATH / f"enterprise_credentials_{connection_id}.enc"
-            with open(storage_path, 'w') as f:
-                f.write(encrypted_creds)
+            # Stream into an owner-only temp file (mkstemp creates it 0o600) and swap
+            # it in, so a failed store leaves the previous credentials intact
+            fd, tmp_path = tempfile.mkstemp(dir=storage_path.parent, prefix=f".{storage_path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    self.vault.encrypt_to_stream(credentials, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, storage_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             
             self.logger.info(f"Enterprise credentials stored securely: {connection_id}")
             
@@ -625,10 +996,14 @@ class EnterpriseSecureStorage(LoggerMixin):
             if not storage_path.exists():
                 raise EncryptionError(f"Enterprise credentials not found: {connection_id}")
             
-            with open(storage_path, 'r') as f:
-                encrypted_creds = f.read()
-            
-            credentials = self.vault.decrypt_data(encrypted_creds)
+            with open(storage_path, 'rb') as f:
+                # Files written before streaming hold a base64 text package
+                streamed = f.read(1) == _STREAM_MAGIC
+                f.seek(0)
+                if streamed:
+                    credentials = self.vault.decrypt_from_stream(f)
+                else:
+                    credentials = self.vault.decrypt_data(f.read().decode('ascii'))
             
             self.logger.debug(f"Enterprise credentials retrieved: {connection_id}")
             return credentials
@@ -643,25 +1018,16 @@ class EnterpriseSecureStorage(LoggerMixin):
             storage_path = settings.UPLOAD_PATH / f"enterprise_credentials_{connection_id}.enc"
             
             if storage_path.exists():
-                # Multiple-pass overwrite for security
+                # Single in-place overwrite; on SSDs wear levelling redirects
+                # further passes to fresh cells anyway
                 file_size = storage_path.stat().st_size
-                with open(storage_path, 'wb') as f:
-                    # Pass 1: Random data
+                with open(storage_path, 'r+b') as f:
                     f.write(secrets.token_bytes(file_size))
                     f.flush()
                     os.fsync(f.fileno())
                     
-                    # Pass 2: Zeros
-                    f.seek(0)
-                    f.write(b'\x00' * file_size)
-                    f.flush()
-                    os.fsync(f.fileno())
-                    
-                    # Pass 3: Random data again
-                    f.seek(0)
-                    f.write(secrets.token_bytes(file_size))
-                    f.flush()
-                    os.fsync(f.fileno())
+                    # Release the blocks so the device can trim them, where supported
+                    _punch_hole(f.fileno(), file_size)
                 
                 storage_path.unlink()
             
@@ -679,10 +1045,7 @@ _enterprise_secure_storage: Optional[EnterpriseSecureStorage] = None
 
 def get_enterprise_vault_manager() -> EnterpriseVaultManager:
     """Get global enterprise vault manager instance"""
-    global _enterprise_vault_manager
-    if _enterprise_vault_manager is None:
-        _enterprise_vault_manager = EnterpriseVaultManager.get_instance()
-    return _enterprise_vault_manager
+    return _enterprise_vault_manager or EnterpriseVaultManager.get_instance()
 
 
 def get_enterprise_secure_storage() -> EnterpriseSecureStorage:
@@ -3,46 +3,97 @@ DafelHub Logging Configuration
 Enterprise-grade logging with structured output and multiple handlers.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import time
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from dafelhub.core.config import settings
 
 
+# Serializes log entries
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+else:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON formatter for structured logging
     """
     
+    _dumps = staticmethod(_json_dumps)
+    
+    # Local-time "YYYY-MM-DDTHH:MM:SS" of the last second formatted
+    _second_cache = (None, "")
+    
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON
         """
+        attrs = record.__dict__
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
+            "timestamp": "%s.%03d" % (self._second_prefix(attrs["created"]), attrs["msecs"]),
+            "level": attrs["levelname"],
+            "logger": attrs["name"],
             "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
+            "module": attrs["module"],
+            "function": attrs["funcName"],
+            "line": attrs["lineno"],
         }
         
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+        if attrs["exc_info"]:
+            log_entry["exception"] = self.formatException(attrs["exc_info"])
             
-        if hasattr(record, "extra_data"):
-            log_entry["extra"] = record.extra_data
+        if "extra_data" in attrs:
+            log_entry["extra"] = attrs["extra_data"]
             
-        return json.dumps(log_entry, ensure_ascii=False)
+        return self._dumps(log_entry)
+    
+    def _second_prefix(self, created: float) -> str:
+        """
+        Date and time to the second, formatted once per second
+        """
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._second_cache = (second, prefix)
+        return prefix
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue records intact so the file handlers still see exc_info and extra data
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve the message on the calling thread; formatting happens in the listener
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class DafelHubLogger:
@@ -54,6 +105,9 @@ class DafelHubLogger:
         self.console = Console()
         self.log_dir = Path("logs")
         self.log_dir.mkdir(exist_ok=True)
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        # Registered once; shutdown stops whichever listener is current at exit
+        atexit.register(self.shutdown)
         
     def setup_logging(self) -> None:
         """
@@ -94,10 +148,17 @@ class DafelHubLogger:
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(JSONFormatter())
         
-        # Add handlers
+        # File handlers run on a listener thread; callers only enqueue the record
+        self.shutdown()
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        
+        # Add handlers; the Rich console stays inline to keep terminal output ordered
         root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(error_handler)
+        root_logger.addHandler(_RecordQueueHandler(log_queue))
         
         # Set specific logger levels
         logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -107,6 +168,16 @@ class DafelHubLogger:
         # Application logger
         app_logger = logging.getLogger("dafelhub")
         app_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    
+    def shutdown(self) -> None:
+        """
+        Flush queued records to the file handlers and stop the listener
+        """
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
 
 
 # Global logger instance
@@ -126,15 +197,31 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def set_log_level(level: str) -> None:
+    """
+    Change the console and application log level at runtime
+    """
+    get_logger("dafelhub")
+    numeric_level = getattr(logging, level.upper())
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    for handler in root_logger.handlers:
+        if isinstance(handler, RichHandler):
+            handler.setLevel(numeric_level)
+    
+    logging.getLogger("dafelhub").setLevel(numeric_level)
+
+
 class LoggerMixin:
     """
     Mixin to add logging capabilities to classes
     """
     
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
         """
-        Get logger for this class
+        Get logger for this class, resolved once per instance
         """
         return get_logger(self.__class__.__module__ + "." + self.__class__.__name__)
     
@@ -146,9 +233,17 @@ class LoggerMixin:
     ) -> None:
         """
         Log with additional context data
+        
+        Disabled levels return before a record is built. Callers whose
+        extra_data is costly to assemble should guard it with
+        self.logger.isEnabledFor(level) themselves.
         """
-        record = self.logger.makeRecord(
-            name=self.logger.name,
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+        
+        record = logger.makeRecord(
+            name=logger.name,
             level=level,
             fn="",
             lno=0,
@@ -160,4 +255,4 @@ class LoggerMixin:
         if extra_data:
             record.extra_data = extra_data
             
-        self.logger.handle(record)
\ No newline at end of file
+        logger.handle(record)
\ No newline at end of file
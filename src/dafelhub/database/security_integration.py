@@ -17,7 +17,7 @@ from enum import Enum
 
 from dafelhub.core.logging import get_logger, LoggerMixin
 from dafelhub.core.connections import ConnectionConfig, IDataSourceConnector
-from dafelhub.core.enterprise_vault import EnterpriseVaultManager, EncryptedData
+from dafelhub.core.enterprise_vault import EncryptedData, get_enterprise_vault_manager
 from dafelhub.database.connectors.connection_factory import DatabaseType, connection_factory
 from dafelhub.security.authentication import SecurityContext, JWTManager, AuthenticationError
 from dafelhub.security.audit import AuditLogger, AuditEventType, ThreatLevel
@@ -188,7 +188,7 @@ class DatabaseSecurityManager(LoggerMixin):
     """
     
     def __init__(self):
-        self.vault = EnterpriseVaultManager()
+        self.vault = get_enterprise_vault_manager()
         self.jwt_manager = JWTManager()
         self.audit_logger = AuditLogger()
         
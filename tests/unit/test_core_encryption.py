@@ -0,0 +1,109 @@
+"""
+Unit tests for core encryption module.
+
+Tests that packages written by earlier releases still decrypt, and that
+credential storage never loses stored data.
+"""
+import base64
+import io
+
+import pytest
+
+from dafelhub.core.config import settings
+from dafelhub.core.encryption import EncryptionError, SecureStorage, VaultManager
+
+
+# Master key the fixtures below were encrypted under
+MASTER_KEY = base64.b64encode(bytes(range(32))).decode('utf-8')
+
+# JSON package from the original VaultManager (PBKDF2-derived key, version 1)
+LEGACY_PACKAGE = (
+    "eyJ2ZXJzaW9uIjogIjEuMCIsICJrZXlfaWQiOiAiY29ubl9maXh0dXJlIiwgImtleV92ZXJzaW9uIjogMSwgImFsZ29yaXRobSI6ICJB"
+    "RVMtMjU2LUdDTSIsICJub25jZSI6ICJWSHNMKzdNS1gyd2dROFpYIiwgImNpcGhlcnRleHQiOiAid1RXUUlUbmdPZkRGMmlDQkZpRmdX"
+    "OUlna05FMmdtN2dQSi9xcCtHWVdNNDZDN1laQ05CRll3ZmYwdVVkbFR5WGl1Q3BQc2lvVlE9PSIsICJhYWQiOiAiZXlKclpYbGZhV1Fp"
+    "T2lBaVkyOXVibDltYVhoMGRYSmxJaXdnSW5abGNuTnBiMjRpT2lBeExDQWlkR2x0WlhOMFlXMXdJam9nSWpJd01qWXRNVEF0TVRoVU1E"
+    "ZzZNems2TXpndU5qYzBNekl4SW4wPSIsICJ0aW1lc3RhbXAiOiAiMjAyNi0xMC0xOFQwODozOTozOC42NzQ0MzYifQ=="
+)
+
+# Same key id after one rotate_key (version 2)
+LEGACY_ROTATED_PACKAGE = (
+    "eyJ2ZXJzaW9uIjogIjEuMCIsICJrZXlfaWQiOiAiY29ubl9maXh0dXJlIiwgImtleV92ZXJzaW9uIjogMiwgImFsZ29yaXRobSI6ICJB"
+    "RVMtMjU2LUdDTSIsICJub25jZSI6ICJ1SFRkMENyd0lucXZmSFQ3IiwgImNpcGhlcnRleHQiOiAiWFVwTWdERjA5Y0tORmNtTzJVMnRD"
+    "RGN6YW5iZHZON2NGMzM5UG1pUiIsICJhYWQiOiAiZXlKclpYbGZhV1FpT2lBaVkyOXVibDltYVhoMGRYSmxJaXdnSW5abGNuTnBiMjRp"
+    "T2lBeUxDQWlkR2x0WlhOMFlXMXdJam9nSWpJd01qWXRNVEF0TVRoVU1EZzZNems2TXpndU56QXdNREV3SW4wPSIsICJ0aW1lc3RhbXAi"
+    "OiAiMjAyNi0xMC0xOFQwODozOTozOC43MDAwOTUifQ=="
+)
+
+# Binary frame (format 1) written before frames carried a kdf_id
+UNTAGGED_FRAME = "REZIMQEMY29ubl9maXh0dXJlAAAAARjfkvuqCgN128JYZMxFJqH+3rdjie+HkNrNz58E+Mht/HIWsMFxCBc8MuHqBRWUnDk="
+
+# Chunked frame (format 2) written before frames carried a kdf_id
+UNTAGGED_CHUNKED_FRAME = (
+    "REZIMQIMY29ubl9maXh0dXJlAAAAARjfkvvaOLXnWhFRqpXuCe0AAAAgGPmCD03vUrbg/LiGEl0rPDDYiuH54urNU+YNzcCICMg="
+)
+
+
+@pytest.fixture
+def vault(monkeypatch) -> VaultManager:
+    """Vault holding the master key the fixtures were written under."""
+    monkeypatch.setenv('DAFELHUB_MASTER_KEY', MASTER_KEY)
+    return VaultManager()
+
+
+class TestVaultManagerCompatibility:
+    """Test cases for decrypting packages from earlier releases."""
+
+    def test_decrypt_legacy_package(self, vault):
+        """Test a JSON package from the original release decrypts."""
+        assert vault.decrypt_data(LEGACY_PACKAGE) == {"user": "dafel", "password": "s3cret"}
+
+    def test_decrypt_legacy_rotated_package(self, vault):
+        """Test a JSON package sealed under a rotated key version decrypts."""
+        vault.rotate_key("conn_fixture")
+
+        assert vault.decrypt_data(LEGACY_ROTATED_PACKAGE) == "rotated secret"
+
+    def test_reject_unissued_key_version(self, vault):
+        """Test a package naming a key version never issued is refused before derivation."""
+        with pytest.raises(EncryptionError):
+            vault.decrypt_data(LEGACY_ROTATED_PACKAGE)
+
+        assert not any(version == 2 for _, version, _ in vault._derived_keys)
+
+    def test_decrypt_untagged_frame(self, vault):
+        """Test a binary frame without a kdf_id decrypts."""
+        assert vault.decrypt_data(UNTAGGED_FRAME) == "framed secret"
+
+    def test_decrypt_untagged_chunked_frame(self, vault):
+        """Test a chunked frame without a kdf_id decrypts."""
+        stream = io.BytesIO(base64.b64decode(UNTAGGED_CHUNKED_FRAME))
+        assert vault.decrypt_from_stream(stream) == {"chunked": True}
+
+    def test_round_trip(self, vault):
+        """Test new packages decrypt alongside legacy ones under the same key id."""
+        encrypted = vault.encrypt_data({"user": "dafel"}, "conn_fixture")
+
+        assert vault.decrypt_data(encrypted) == {"user": "dafel"}
+        assert vault.decrypt_data(LEGACY_PACKAGE) == {"user": "dafel", "password": "s3cret"}
+        assert vault.get_package_info(encrypted)["key_id"] == "conn_fixture"
+
+
+class TestSecureStorage:
+    """Test cases for credential file storage."""
+
+    @pytest.fixture
+    def storage(self, vault, tmp_path, monkeypatch) -> SecureStorage:
+        """Storage writing to an upload directory under tmp_path."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / settings.UPLOAD_PATH).mkdir(parents=True, exist_ok=True)
+        return SecureStorage(vault)
+
+    def test_failed_store_keeps_previous_credentials(self, storage):
+        """Test a store that fails to encrypt leaves the stored credentials intact."""
+        storage.store_connection_credentials("db", {"password": "old"})
+
+        with pytest.raises(EncryptionError):
+            storage.store_connection_credentials("db", {"password": object()})
+
+        assert storage.retrieve_connection_credentials("db") == {"password": "old"}
+        assert [path.name for path in settings.UPLOAD_PATH.iterdir()] == ["credentials_db.enc"]